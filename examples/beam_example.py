@@ -5,19 +5,39 @@ in a Beam sandbox environment through the upathtools interface.
 """
 
 import asyncio
-from pathlib import Path
+import sys
 
 from beta9 import SandboxProcessResponse
 
 from upathtools.filesystems import BeamFS
 
 
-async def basic_file_operations():
+# Encoded once at import; contains non-ASCII characters so it cannot be a bytes literal
+DEMO_SCRIPT = """
+import os
+import sys
+import json
+
+# Create some demo data
+data = {
+    "message": "Hello from Beam sandbox!",
+    "python_version": sys.version,
+    "working_directory": os.getcwd(),
+    "environment_vars": dict(os.environ)
+}
+
+# Save to JSON file
+with open("/workspace/output.json", "w") as f:
+    json.dump(data, f, indent=2)
+
+print("✅ Script executed successfully!")
+print(f"📁 Working in: {os.getcwd()}")
+print(f"🐍 Python version: {sys.version.split()[0]}")
+""".encode()
+
+
+async def basic_file_operations(fs: BeamFS):
     """Demonstrate basic file operations with BeamFS."""
-    print("🚀 Creating Beam sandbox...")
-    fs = BeamFS(cpu=1.0, memory=512, keep_warm_seconds=300)
-    await fs.set_session()
-    print(f"✅ Connected to Beam sandbox: {fs._sandbox_id}")
     test_file = "/workspace/hello.txt"
     content = b"Hello from BeamFS!"
     print(f"📝 Writing file: {test_file}")
@@ -40,45 +60,20 @@ async def basic_file_operations():
     nested_file = f"{test_dir}/nested.txt"
     await fs._pipe_file(nested_file, b"Nested content")
     print(f"📝 Created nested file: {nested_file}")
-    await fs._rm_file(nested_file)
+    await asyncio.gather(fs._rm_file(nested_file), fs._rm_file(test_file))
     await fs._rmdir(test_dir)
-    await fs._rm_file(test_file)
     print("🧹 Cleaned up test files")
-    await fs.close_session()
-    print("🔒 Closed Beam session")
+    sys.stdout.flush()
 
 
-async def python_execution_example():
+async def python_execution_example(fs: BeamFS):
     """Demonstrate Python code execution in Beam sandbox."""
     print("\n🐍 Testing Python code execution...")
-    fs = BeamFS(keep_warm_seconds=300)
-    await fs.set_session()
     sandbox = await fs._get_sandbox()
     script_path = "/workspace/demo_script.py"
-    script_content = """
-import os
-import sys
-import json
-
-# Create some demo data
-data = {
-    "message": "Hello from Beam sandbox!",
-    "python_version": sys.version,
-    "working_directory": os.getcwd(),
-    "environment_vars": dict(os.environ)
-}
-
-# Save to JSON file
-with open("/workspace/output.json", "w") as f:
-    json.dump(data, f, indent=2)
-
-print("✅ Script executed successfully!")
-print(f"📁 Working in: {os.getcwd()}")
-print(f"🐍 Python version: {sys.version.split()[0]}")
-""".encode()
 
     print("📝 Creating Python script...")
-    await fs._pipe_file(script_path, script_content)
+    await fs._pipe_file(script_path, DEMO_SCRIPT)
 
     # Execute the script
     print("🚀 Executing Python script in sandbox...")
@@ -87,59 +82,67 @@ print(f"🐍 Python version: {sys.version.split()[0]}")
     print(f"Exit code: {result.exit_code}")
     print(f"Output: {result.result}")
 
-    if await fs._exists("/workspace/output.json"):
+    to_remove = [script_path]
+    try:
         output_content = await fs._cat_file("/workspace/output.json")
+    except FileNotFoundError:
+        pass
+    else:
         print("📄 Generated output.json:")
         print(output_content.decode())
-        await fs._rm_file("/workspace/output.json")
+        to_remove.append("/workspace/output.json")
 
-    await fs._rm_file(script_path)
+    await asyncio.gather(*(fs._rm_file(path) for path in to_remove))
     print("🧹 Cleaned up script files")
-    await fs.close_session()
+    sys.stdout.flush()
 
 
-async def file_upload_example():
+async def file_upload_example(fs: BeamFS):
     """Demonstrate file upload from local filesystem."""
     print("\n📤 Testing file upload...")
 
-    # Create a local test file
-    local_file = Path("test_upload.txt")
-    local_file.write_text("This file was uploaded from local filesystem! 📤")
-
-    fs = BeamFS(keep_warm_seconds=300)
-
-    await fs.set_session()
-
-    # Upload the file
+    # The payload is already in memory, so write it directly instead of
+    # round-tripping through a local temp file
+    content = "This file was uploaded from local filesystem! 📤".encode()
     remote_path = "/workspace/uploaded_file.txt"
-    print(f"📤 Uploading {local_file} to {remote_path}")
-    await fs._put_file(str(local_file), remote_path)
+    print(f"📤 Uploading content to {remote_path}")
+    await fs._pipe_file(remote_path, content)
 
     # Verify upload
-    if await fs._exists(remote_path):
-        content = await fs._cat_file(remote_path)
-        print(f"✅ Upload successful! Content: {content.decode()}")
+    try:
+        read_content = await fs._cat_file(remote_path)
+    except FileNotFoundError:
+        print("❌ Upload failed!")
+    else:
+        print(f"✅ Upload successful! Content: {read_content.decode()}")
 
         # Clean up
         await fs._rm_file(remote_path)
-    else:
-        print("❌ Upload failed!")
-
-    await fs.close_session()
-    # Clean up local file
-    if local_file.exists():
-        local_file.unlink()
+    sys.stdout.flush()
 
 
 async def main():
     """Run all examples."""
     print("🌟 BeamFS Example - Beam Sandbox Filesystem Integration\n")
-    await basic_file_operations()
-    # await sync_operations_example()
-    # await python_execution_example()
-    # await file_upload_example()
+    print("🚀 Creating Beam sandbox...")
+    fs = BeamFS(cpu=1.0, memory=512, keep_warm_seconds=300)
+    await fs.set_session()
+    print(f"✅ Connected to Beam sandbox: {fs._sandbox_id}")
+    try:
+        await basic_file_operations(fs)
+        # await python_execution_example(fs)
+        # await file_upload_example(fs)
+    finally:
+        await fs.close_session()
+        print("🔒 Closed Beam session")
     print("\n🎉 All examples completed successfully!")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Flush once per scenario instead of on every line
+    sys.stdout.reconfigure(line_buffering=False)  # pyright: ignore[reportAttributeAccessIssue]
+    try:
+        from uvloop import new_event_loop as loop_factory
+    except ImportError:  # uvloop is optional, the stock loop works just as well
+        loop_factory = None
+    asyncio.run(main(), loop_factory=loop_factory)
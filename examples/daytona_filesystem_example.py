@@ -3,16 +3,54 @@
 import asyncio
 import os
 from pathlib import Path
+import posixpath
+import sys
 
 from upathtools.filesystems import DaytonaFS
 
 
-async def main():
+API_KEY = os.getenv("DAYTONA_API_KEY")
+MAX_CONCURRENT_DELETES = 16
+
+
+PROCESSING_SCRIPT = b"""#!/usr/bin/env python3
+import csv
+import json
+
+# Read input data
+with open('/workspace/data_processing/input.csv', 'r') as f:
+    reader = csv.DictReader(f)
+    data = list(reader)
+
+# Process data (add age category)
+for row in data:
+    age = int(row['age'])
+    row['category'] = 'young' if age < 30 else 'mature'
+
+# Write output
+with open('/workspace/data_processing/output.json', 'w') as f:
+    json.dump(data, f, indent=2)
+
+print(f"Processed {len(data)} records")
+"""
+
+
+async def remove_files(fs: DaytonaFS, paths: list[str]) -> None:
+    """Delete files concurrently with a bounded number of requests in flight."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DELETES)
+
+    async def remove(path: str) -> None:
+        async with semaphore:
+            await fs._rm_file(path)
+
+    async with asyncio.TaskGroup() as tg:
+        for path in paths:
+            tg.create_task(remove(path))
+
+
+async def basic_example(daytona_fs: DaytonaFS):
     """Demonstrate Daytona filesystem operations."""
-    daytona_fs = DaytonaFS()
     print("=== Daytona Filesystem Demo ===")
-    await daytona_fs.set_session()
-    print(f"Connected to sandbox: {daytona_fs._sandbox_id}")
     test_dir = "/workspace/daytona_test"
     await daytona_fs._mkdir(test_dir)
     print(f"Created directory: {test_dir}")
@@ -22,16 +60,16 @@ async def main():
     print(f"Written {len(content)} bytes to {test_file}")
     read_content = await daytona_fs._cat_file(test_file)
     print(f"Read back: {read_content.decode()}")
-    exists = await daytona_fs._exists(test_file)
-    is_file = await daytona_fs._isfile(test_file)
-    size = await daytona_fs._size(test_file)
-    mtime = await daytona_fs._modified(test_file)
-    print(f"File exists: {exists}")
-    print(f"Is file: {is_file}")
-    print(f"Size: {size} bytes")
-    print(f"Modified time: {mtime}")
-    print(f"\nContents of {test_dir}:")
+    # A single listing carries all the metadata we need for the file
     items = await daytona_fs._ls(test_dir, detail=True)
+    by_name = {item["name"]: item for item in items}
+    info = by_name.get(test_file)
+    print(f"File exists: {info is not None}")
+    if info is not None:
+        print(f"Is file: {info['type'] == 'file'}")
+        print(f"Size: {info['size']} bytes")
+        print(f"Modified time: {info['mtime']}")
+    print(f"\nContents of {test_dir}:")
     for item in items:
         print(f"  {item['name']} ({item['type']}, {item['size']} bytes)")
     files_data = {
@@ -40,9 +78,9 @@ async def main():
         f"{test_dir}/script.py": b"#!/usr/bin/env python3\nprint('Hello from Daytona!')",
     }
 
-    for file_path, file_content in files_data.items():
-        await daytona_fs._pipe_file(file_path, file_content)
-        print(f"Created {Path(file_path).name}")
+    await asyncio.gather(*(daytona_fs._pipe_file(p, c) for p, c in files_data.items()))
+    for file_path in files_data:
+        print(f"Created {posixpath.basename(file_path)}")
 
     print(f"\nSearching for Python files in {test_dir}:")
     python_files = await daytona_fs._find(test_dir, pattern="*.py")
@@ -61,7 +99,7 @@ async def main():
     old_name = f"{test_dir}/data1.json"
     new_name = f"{test_dir}/renamed_data.json"
     await daytona_fs._mv_file(old_name, new_name)
-    print(f"Renamed {Path(old_name).name} to {Path(new_name).name}")
+    print(f"Renamed {posixpath.basename(old_name)} to {posixpath.basename(new_name)}")
 
     # Upload a local file (if it exists)
     local_file = Path(__file__).parent / "sample.txt"
@@ -70,18 +108,11 @@ async def main():
         await daytona_fs._put_file(str(local_file), remote_file)
         print(f"Uploaded {local_file} to {remote_file}")
     else:
-        # Create a sample file to upload
+        # No local sample available, write the content directly
         sample_content = b"This is a sample file for upload testing.\nLine 2\nLine 3"
-        local_sample = "/tmp/local_sample.txt"
-        with open(local_sample, "wb") as f:  # noqa: PTH123
-            f.write(sample_content)
-
         remote_sample = f"{test_dir}/uploaded_local_sample.txt"
-        await daytona_fs._put_file(local_sample, remote_sample)
-        print(f"Uploaded {local_sample} to {remote_sample}")
-
-        # Clean up local file
-        os.unlink(local_sample)  # noqa: PTH108
+        await daytona_fs._pipe_file(remote_sample, sample_content)
+        print(f"Uploaded {len(sample_content)} bytes to {remote_sample}")
 
     # Test partial file reading
     large_file = f"{test_dir}/large_content.txt"
@@ -101,7 +132,7 @@ async def main():
     items = await daytona_fs._ls(test_dir, detail=True)
     for item in items:
         item_type = "📁" if item["type"] == "directory" else "📄"
-        print(f"  {item_type} {Path(item['name']).name} ({item['size']} bytes)")
+        print(f"  {item_type} {posixpath.basename(item['name'])} ({item['size']} bytes)")
 
     # Test simple listing (names only)
     print("\nSimple listing (names only):")
@@ -111,31 +142,24 @@ async def main():
 
     # Clean up (optional)
     print("\nCleaning up...")
-    for item in items:
-        if item["type"] == "file":
-            await daytona_fs._rm_file(item["name"])
-            print(f"Removed file: {Path(item['name']).name}")
+    files = [item["name"] for item in items if item["type"] == "file"]
+    await remove_files(daytona_fs, files)
+    if files:
+        print("\n".join(f"Removed file: {posixpath.basename(name)}" for name in files))
 
     await daytona_fs._rmdir(test_dir)
     print(f"Removed directory: {test_dir}")
+    sys.stdout.flush()
 
-    await daytona_fs.close_session()
-    print("Session closed.")
 
-
-async def advanced_example():
+async def advanced_example(daytona_fs: DaytonaFS):
     """Advanced usage example with file processing."""
     print("\n=== Advanced File Processing Demo ===")
 
-    api_key = os.getenv("DAYTONA_API_KEY")
-    if not api_key:
+    if not API_KEY:
         print("Please set DAYTONA_API_KEY environment variable")
         return
 
-    daytona_fs = DaytonaFS(api_key=api_key)
-
-    await daytona_fs.set_session()
-
     # Create a data processing workspace
     workspace = "/workspace/data_processing"
     await daytona_fs._mkdir(workspace)
@@ -147,32 +171,12 @@ Bob,30,London
 Charlie,35,Tokyo
 Diana,28,Paris"""
 
-    await daytona_fs._pipe_file(f"{workspace}/input.csv", csv_data)
-
-    # Create a processing script
-    python_script = b"""#!/usr/bin/env python3
-import csv
-import json
-
-# Read input data
-with open('/workspace/data_processing/input.csv', 'r') as f:
-reader = csv.DictReader(f)
-data = list(reader)
-
-# Process data (add age category)
-for row in data:
-age = int(row['age'])
-row['category'] = 'young' if age < 30 else 'mature'
-
-# Write output
-with open('/workspace/data_processing/output.json', 'w') as f:
-json.dump(data, f, indent=2)
-
-print(f"Processed {len(data)} records")
-"""
-
+    # Write the input data and the processing script concurrently
     script_path = f"{workspace}/process.py"
-    await daytona_fs._pipe_file(script_path, python_script)
+    await asyncio.gather(
+        daytona_fs._pipe_file(f"{workspace}/input.csv", csv_data),
+        daytona_fs._pipe_file(script_path, PROCESSING_SCRIPT),
+    )
     await daytona_fs._chmod(script_path, 0o755)
 
     print("Created data processing workflow")
@@ -189,17 +193,31 @@ print(f"Processed {len(data)} records")
         print(f"  {file['name']} ({file['size']} bytes)")
 
     # Clean up
-    for file in files:
-        await daytona_fs._rm_file(file["name"])
+    await remove_files(daytona_fs, [file["name"] for file in files])
     await daytona_fs._rmdir(workspace)
+    sys.stdout.flush()
 
-    await daytona_fs.close_session()
 
+async def main():
+    """Run all examples against a single sandbox session."""
+    daytona_fs = DaytonaFS(api_key=API_KEY)
+    await daytona_fs.set_session()
+    print(f"Connected to sandbox: {daytona_fs._sandbox_id}")
+    try:
+        await basic_example(daytona_fs)
+        await advanced_example(daytona_fs)
+    finally:
+        await daytona_fs.close_session()
+        print("Session closed.")
 
-if __name__ == "__main__":
-    # Run async example
-    asyncio.run(main())
 
-    asyncio.run(advanced_example())
+if __name__ == "__main__":
+    # Flush once per scenario instead of on every line
+    sys.stdout.reconfigure(line_buffering=False)  # pyright: ignore[reportAttributeAccessIssue]
+    try:
+        from uvloop import new_event_loop as loop_factory
+    except ImportError:  # uvloop is optional, the stock loop works just as well
+        loop_factory = None
+    asyncio.run(main(), loop_factory=loop_factory)
 
     print("\n=== Daytona Filesystem Demo Complete ===")
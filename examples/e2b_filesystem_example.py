@@ -1,12 +1,49 @@
 """Example demonstrating E2B filesystem usage with upathtools."""
 
 import asyncio
-import os
 from pathlib import Path
+import posixpath
+import sys
 
 from upathtools.filesystems import E2BFS
 
 
+MAX_CONCURRENT_DELETES = 16
+
+
+DEMO_SCRIPT = b"""
+import os
+import sys
+
+print("Python version:", sys.version)
+print("Current directory:", os.getcwd())
+print("Environment variables:")
+for key, value in sorted(os.environ.items())[:5]:  # Show first 5
+    print(f"  {key}={value}")
+
+# Create a data file
+with open("data.txt", "w") as f:
+    f.write("Generated from Python script\\n")
+    f.write("Line 2\\n")
+    f.write("Line 3\\n")
+
+print("\\nCreated data.txt")
+"""
+
+
+async def remove_files(fs: E2BFS, paths: list[str]) -> None:
+    """Delete files concurrently with a bounded number of requests in flight."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DELETES)
+
+    async def remove(path: str) -> None:
+        async with semaphore:
+            await fs._rm_file(path)
+
+    async with asyncio.TaskGroup() as tg:
+        for path in paths:
+            tg.create_task(remove(path))
+
+
 async def main():
     """Demonstrate E2B filesystem operations."""
     e2b_fs = E2BFS(template="code-interpreter-v1")
@@ -22,42 +59,23 @@ async def main():
     print(f"Written {len(content)} bytes to {test_file}")
     read_content = await e2b_fs._cat_file(test_file)
     print(f"Read back: {read_content.decode()}")
-    exists = await e2b_fs._exists(test_file)
-    is_file = await e2b_fs._isfile(test_file)
-    size = await e2b_fs._size(test_file)
-    mtime = await e2b_fs._modified(test_file)
-    print(f"File exists: {exists}")
-    print(f"Is file: {is_file}")
-    print(f"Size: {size} bytes")
-    print(f"Modified time: {mtime}")
+    # A single listing carries all the metadata we need for the file
+    items = await e2b_fs._ls(test_dir, detail=True)
+    by_name = {item["name"]: item for item in items}
+    info = by_name.get(test_file)
+    print(f"File exists: {info is not None}")
+    if info is not None:
+        print(f"Is file: {info['type'] == 'file'}")
+        print(f"Size: {info['size']} bytes")
+        print(f"Modified time: {info['mtime']}")
     # List directory contents
     print(f"\nContents of {test_dir}:")
-    items = await e2b_fs._ls(test_dir, detail=True)
     for item in items:
         print(f"  {item['name']} ({item['type']}, {item['size']} bytes)")
 
     # Create a Python script and execute it
-    script_content = b"""
-import os
-import sys
-
-print("Python version:", sys.version)
-print("Current directory:", os.getcwd())
-print("Environment variables:")
-for key, value in sorted(os.environ.items())[:5]:  # Show first 5
-    print(f"  {key}={value}")
-
-# Create a data file
-with open("data.txt", "w") as f:
-    f.write("Generated from Python script\\n")
-    f.write("Line 2\\n")
-    f.write("Line 3\\n")
-
-print("\\nCreated data.txt")
-"""
-
     script_file = f"{test_dir}/test_script.py"
-    await e2b_fs._pipe_file(script_file, script_content)
+    await e2b_fs._pipe_file(script_file, DEMO_SCRIPT)
     print(f"\nCreated Python script: {script_file}")
 
     # Execute the script using the sandbox
@@ -74,8 +92,11 @@ print("\\nCreated data.txt")
 
     # Check if the script created the data file
     data_file = f"{test_dir}/data.txt"
-    if await e2b_fs._exists(data_file):
+    try:
         data_content = await e2b_fs._cat_file(data_file)
+    except FileNotFoundError:
+        pass
+    else:
         print(f"\nScript created {data_file}:")
         print(data_content.decode())
 
@@ -86,42 +107,41 @@ print("\\nCreated data.txt")
         await e2b_fs._put_file(str(local_file), remote_file)
         print(f"Uploaded {local_file} to {remote_file}")
     else:
-        # Create a sample file to upload
+        # No local sample available, write the content directly
         sample_content = b"This is a sample file for upload testing."
-        local_sample = "/tmp/local_sample.txt"
-        with open(local_sample, "wb") as f:  # noqa: PTH123
-            f.write(sample_content)
-
         remote_sample = f"{test_dir}/uploaded_local_sample.txt"
-        await e2b_fs._put_file(local_sample, remote_sample)
-        print(f"Uploaded {local_sample} to {remote_sample}")
-
-        # Clean up local file
-        os.unlink(local_sample)  # noqa: PTH108
+        await e2b_fs._pipe_file(remote_sample, sample_content)
+        print(f"Uploaded {len(sample_content)} bytes to {remote_sample}")
 
     # Final directory listing
     print(f"\nFinal contents of {test_dir}:")
     items = await e2b_fs._ls(test_dir, detail=True)
     for item in items:
         item_type = "📁" if item["type"] == "directory" else "📄"
-        print(f"  {item_type} {Path(item['name']).name} ({item['size']} bytes)")
+        print(f"  {item_type} {posixpath.basename(item['name'])} ({item['size']} bytes)")
 
     # Clean up (optional)
     print("\nCleaning up...")
-    for item in items:
-        if item["type"] == "file":
-            await e2b_fs._rm_file(item["name"])
-            print(f"Removed file: {Path(item['name']).name}")
+    files = [item["name"] for item in items if item["type"] == "file"]
+    await remove_files(e2b_fs, files)
+    if files:
+        print("\n".join(f"Removed file: {posixpath.basename(name)}" for name in files))
 
     await e2b_fs._rmdir(test_dir)
     print(f"Removed directory: {test_dir}")
 
     await e2b_fs.close_session()
     print("Session closed.")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
-    # Run async example
-    asyncio.run(main())
+    # Flush once per scenario instead of on every line
+    sys.stdout.reconfigure(line_buffering=False)  # pyright: ignore[reportAttributeAccessIssue]
+    try:
+        from uvloop import new_event_loop as loop_factory
+    except ImportError:  # uvloop is optional, the stock loop works just as well
+        loop_factory = None
+    asyncio.run(main(), loop_factory=loop_factory)
 
     print("\n=== E2B Filesystem Demo Complete ===")
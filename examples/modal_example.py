@@ -4,76 +4,91 @@ This example demonstrates how to use ModalFS to interact with files
 in a Modal sandbox environment through the upathtools interface.
 """
 
-import asyncio
-import contextlib
-from pathlib import Path
-
-from upathtools.filesystems import ModalFS
-
-
-async def basic_file_operations():
-    """Demonstrate basic file operations with ModalFS."""
-    print("🚀 Creating Modal sandbox...")
+from __future__ import annotations
 
-    # Create filesystem instance
-    fs = ModalFS(
-        app_name="upathtools-demo",
-        timeout=600,  # 10 minutes
-        idle_timeout=300,  # 5 minutes idle timeout
-    )
-
-    try:
-        await fs.set_session()
-        print(f"✅ Connected to Modal sandbox: {fs._sandbox_id}")
-
-        # Create a test file
-        test_file = "/tmp/hello.txt"
-        content = b"Hello from ModalFS!"
+import asyncio
+import sys
+from typing import TYPE_CHECKING
 
-        print(f"📝 Writing file: {test_file}")
-        await fs._pipe_file(test_file, content)
+from fsspec.asyn import sync
 
-        # Check if file exists
-        exists = await fs._exists(test_file)
-        print(f"📁 File exists: {exists}")
+from upathtools.filesystems import ModalFS
 
-        # Read file back
-        read_content = await fs._cat_file(test_file)
-        print(f"📖 File content: {read_content.decode()}")
 
-        # Get file info
-        size = await fs._size(test_file)
-        print(f"📏 File size: {size} bytes")
+if TYPE_CHECKING:
+    import modal
 
-        # List files in directory
-        print("📋 Files in /tmp:")
-        files = await fs._ls("/tmp", detail=True)
-        for file_info in files[:5]:  # Show first 5 files
-            file_type = "📁" if file_info["type"] == "directory" else "📄"
-            print(f"  {file_type} {file_info['name']}")
 
-        # Create a directory
-        test_dir = "/tmp/test_dir"
-        await fs._mkdir(test_dir)
-        print(f"📁 Created directory: {test_dir}")
+# Encoded once at import; contains non-ASCII characters so it cannot be a bytes literal
+DEMO_SCRIPT = """
+import os
+import sys
+import json
 
-        # Create nested file
-        nested_file = f"{test_dir}/nested.txt"
-        await fs._pipe_file(nested_file, b"Nested content")
-        print(f"📝 Created nested file: {nested_file}")
+# Create some demo data
+data = {
+    "message": "Hello from Modal sandbox!",
+    "python_version": sys.version,
+    "working_directory": os.getcwd(),
+    "pid": os.getpid()
+}
 
-        # Clean up
-        await fs._rm_file(nested_file)
-        await fs._rmdir(test_dir)
-        await fs._rm_file(test_file)
-        print("🧹 Cleaned up test files")
+# Save to JSON file
+with open("/tmp/output.json", "w") as f:
+    json.dump(data, f, indent=2)
 
-    finally:
-        await fs.close_session()
-        print("🔒 Closed Modal session")
+print("✅ Script executed successfully!")
+print(f"📁 Working in: {os.getcwd()}")
+print(f"🐍 Python version: {sys.version.split()[0]}")
+""".encode()
 
 
-async def sync_operations_example():
+async def basic_file_operations(fs: ModalFS):
+    """Demonstrate basic file operations with ModalFS."""
+    # Create a test file
+    test_file = "/tmp/hello.txt"
+    content = b"Hello from ModalFS!"
+
+    print(f"📝 Writing file: {test_file}")
+    await fs._pipe_file(test_file, content)
+
+    # Check if file exists
+    exists = await fs._exists(test_file)
+    print(f"📁 File exists: {exists}")
+
+    # Read file back
+    read_content = await fs._cat_file(test_file)
+    print(f"📖 File content: {read_content.decode()}")
+
+    # Get file info
+    size = await fs._size(test_file)
+    print(f"📏 File size: {size} bytes")
+
+    # List files in directory
+    print("📋 Files in /tmp:")
+    files = await fs._ls("/tmp", detail=True)
+    for file_info in files[:5]:  # Show first 5 files
+        file_type = "📁" if file_info["type"] == "directory" else "📄"
+        print(f"  {file_type} {file_info['name']}")
+
+    # Create a directory
+    test_dir = "/tmp/test_dir"
+    await fs._mkdir(test_dir)
+    print(f"📁 Created directory: {test_dir}")
+
+    # Create nested file
+    nested_file = f"{test_dir}/nested.txt"
+    await fs._pipe_file(nested_file, b"Nested content")
+    print(f"📝 Created nested file: {nested_file}")
+
+    # Clean up
+    await asyncio.gather(fs._rm_file(nested_file), fs._rm_file(test_file))
+    await fs._rmdir(test_dir)
+    print("🧹 Cleaned up test files")
+    sys.stdout.flush()
+
+
+def sync_operations_example():
     """Demonstrate synchronous operations using sync wrappers."""
     print("\n🔄 Testing synchronous operations...")
 
@@ -96,116 +111,77 @@ async def sync_operations_example():
         print("🧹 Cleaned up sync test file")
 
     finally:
-        # Close session if needed
-        with contextlib.suppress(Exception):
-            await fs.close_session()
+        # close_session is a no-op when no session was started
+        sync(fs.loop, fs.close_session)
+    sys.stdout.flush()
 
 
-async def python_execution_example():
+async def python_execution_example(fs: ModalFS, sandbox: modal.Sandbox):
     """Demonstrate Python code execution in Modal sandbox."""
     print("\n🐍 Testing Python code execution...")
 
-    fs = ModalFS(app_name="upathtools-python-demo", timeout=600)
+    # Create a Python script
+    script_path = "/tmp/demo_script.py"
 
-    try:
-        await fs.set_session()
-        sandbox = await fs._get_sandbox()
+    print("📝 Creating Python script...")
+    await fs._pipe_file(script_path, DEMO_SCRIPT)
 
-        # Create a Python script
-        script_path = "/tmp/demo_script.py"
-        script_content = """
-import os
-import sys
-import json
+    # Execute the script
+    print("🚀 Executing Python script in sandbox...")
+    process = await sandbox.exec.aio("python", script_path, timeout=30)
 
-# Create some demo data
-data = {
-    "message": "Hello from Modal sandbox!",
-    "python_version": sys.version,
-    "working_directory": os.getcwd(),
-    "pid": os.getpid()
-}
-
-# Save to JSON file
-with open("/tmp/output.json", "w") as f:
-    json.dump(data, f, indent=2)
+    # Collect output in one read without blocking the event loop
+    output = await process.stdout.read.aio()
+    output_lines = [line.strip() for line in output.splitlines()]
+    print("\n".join(f"Output: {line}" for line in output_lines))
 
-print("✅ Script executed successfully!")
-print(f"📁 Working in: {os.getcwd()}")
-print(f"🐍 Python version: {sys.version.split()[0]}")
-""".encode()
-
-        print("📝 Creating Python script...")
-        await fs._pipe_file(script_path, script_content)
-
-        # Execute the script
-        print("🚀 Executing Python script in sandbox...")
-        process = sandbox.exec("python", script_path, timeout=30)
-
-        # Collect output
-        output_lines = []
-        for line in process.stdout:
-            output_lines.append(line.strip())
-            print(f"Output: {line.strip()}")
-
-        # Read the output file
-        if await fs._exists("/tmp/output.json"):
-            output_content = await fs._cat_file("/tmp/output.json")
-            print("📄 Generated output.json:")
-            print(output_content.decode())
-
-            # Clean up
-            await fs._rm_file("/tmp/output.json")
-
-        await fs._rm_file(script_path)
-        print("🧹 Cleaned up script files")
+    # Read the output file
+    to_remove = [script_path]
+    try:
+        output_content = await fs._cat_file("/tmp/output.json")
+    except FileNotFoundError:
+        pass
+    else:
+        print("📄 Generated output.json:")
+        print(output_content.decode())
+        to_remove.append("/tmp/output.json")
 
-    finally:
-        await fs.close_session()
+    # Clean up
+    await asyncio.gather(*(fs._rm_file(path) for path in to_remove))
+    print("🧹 Cleaned up script files")
+    sys.stdout.flush()
 
 
-async def file_upload_example():
+async def file_upload_example(fs: ModalFS):
     """Demonstrate file upload from local filesystem."""
     print("\n📤 Testing file upload...")
 
-    # Create a local test file
-    local_file = Path("test_upload.txt")
-    local_file.write_text("This file was uploaded from local filesystem! 📤")
+    # Note: Modal doesn't have direct upload like other platforms
+    # We simulate this by writing the in-memory content
+    remote_path = "/tmp/uploaded_file.txt"
+    content = "This file was uploaded from local filesystem! 📤".encode()
 
-    fs = ModalFS(app_name="upathtools-upload-demo", timeout=600)
+    print(f"📤 Uploading content to {remote_path}")
+    await fs._pipe_file(remote_path, content)
 
+    # Verify upload
     try:
-        await fs.set_session()
-
-        # Note: Modal doesn't have direct upload like other platforms
-        # We simulate this by writing the content
-        remote_path = "/tmp/uploaded_file.txt"
-        content = local_file.read_bytes()
-
-        print(f"📤 Uploading content to {remote_path}")
-        await fs._pipe_file(remote_path, content)
-
-        # Verify upload
-        if await fs._exists(remote_path):
-            read_content = await fs._cat_file(remote_path)
-            print(f"✅ Upload successful! Content: {read_content.decode()}")
+        read_content = await fs._cat_file(remote_path)
+    except FileNotFoundError:
+        print("❌ Upload failed!")
+    else:
+        print(f"✅ Upload successful! Content: {read_content.decode()}")
 
-            # Clean up
-            await fs._rm_file(remote_path)
-        else:
-            print("❌ Upload failed!")
-
-    finally:
-        await fs.close_session()
-        # Clean up local file
-        if local_file.exists():
-            local_file.unlink()
+        # Clean up
+        await fs._rm_file(remote_path)
+    sys.stdout.flush()
 
 
 async def advanced_modal_features():
     """Demonstrate Modal-specific features."""
     print("\n⚡ Testing Modal-specific features...")
 
+    # Needs its own sandbox because the working directory is fixed at creation
     fs = ModalFS(
         app_name="upathtools-advanced-demo",
         timeout=900,  # 15 minutes
@@ -218,10 +194,8 @@ async def advanced_modal_features():
         sandbox = await fs._get_sandbox()
 
         # Test working directory
-        process = sandbox.exec("pwd", timeout=10)
-        pwd_output = ""
-        for line in process.stdout:
-            pwd_output += line.strip()
+        process = await sandbox.exec.aio("pwd", timeout=10)
+        pwd_output = (await process.stdout.read.aio()).strip()
         print(f"📁 Working directory: {pwd_output}")
 
         # Create file with Modal's native API for comparison
@@ -235,10 +209,10 @@ async def advanced_modal_features():
         print(f"📖 Read back via ModalFS: {content.decode()}")
 
         # Test environment variables (if any)
-        process = sandbox.exec("env", timeout=10)
-        for env_count, line in enumerate(process.stdout):
-            if env_count <= 3:  # Show first 3 env vars  # noqa: PLR2004
-                print(f"🌐 Env: {line.strip()}")
+        # Limit the output inside the sandbox so the full env isn't streamed back
+        process = await sandbox.exec.aio("sh", "-c", "env | head -n 4", timeout=10)
+        async for line in process.stdout:
+            print(f"🌐 Env: {line.strip()}")
 
         # Clean up
         await fs._rm_file("/workspace/native_test.txt")
@@ -246,17 +220,14 @@ async def advanced_modal_features():
 
     finally:
         await fs.close_session()
+    sys.stdout.flush()
 
 
-async def error_handling_example():
+async def error_handling_example(fs: ModalFS):
     """Demonstrate error handling patterns."""
     print("\n❌ Testing error handling...")
 
-    fs = ModalFS(app_name="upathtools-error-demo", timeout=600)
-
     try:
-        await fs.set_session()
-
         # Test file not found
         try:
             await fs._cat_file("/nonexistent/file.txt")
@@ -284,8 +255,7 @@ async def error_handling_example():
 
     except Exception as e:  # noqa: BLE001
         print(f"⚠️ Unexpected error: {e}")
-    finally:
-        await fs.close_session()
+    sys.stdout.flush()
 
 
 async def main():
@@ -293,12 +263,27 @@ async def main():
     print("🌟 ModalFS Example - Modal Sandbox Filesystem Integration\n")
 
     try:
-        await basic_file_operations()
-        await sync_operations_example()
-        await python_execution_example()
-        await file_upload_example()
+        print("🚀 Creating Modal sandbox...")
+        fs = ModalFS(
+            app_name="upathtools-demo",
+            timeout=600,  # 10 minutes
+            idle_timeout=300,  # 5 minutes idle timeout
+        )
+        await fs.set_session()
+        sandbox = await fs._get_sandbox()
+        print(f"✅ Connected to Modal sandbox: {fs._sandbox_id}")
+        try:
+            await basic_file_operations(fs)
+            await python_execution_example(fs, sandbox)
+            await file_upload_example(fs)
+            await error_handling_example(fs)
+        finally:
+            await fs.close_session()
+            print("🔒 Closed Modal session")
+
+        # Sync wrappers block, so run them off the event loop
+        await asyncio.to_thread(sync_operations_example)
         await advanced_modal_features()
-        await error_handling_example()
 
         print("\n🎉 All examples completed successfully!")
         print("\n💡 Note: Some features like file metadata (size, mtime) are")
@@ -316,4 +301,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Flush once per scenario instead of on every line
+    sys.stdout.reconfigure(line_buffering=False)  # pyright: ignore[reportAttributeAccessIssue]
+    try:
+        from uvloop import new_event_loop as loop_factory
+    except ImportError:  # uvloop is optional, the stock loop works just as well
+        loop_factory = None
+    asyncio.run(main(), loop_factory=loop_factory)
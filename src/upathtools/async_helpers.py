@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 from asyncio import get_running_loop
 import asyncio.events
+import contextvars
 import functools
 from functools import partial, wraps
 import threading
@@ -107,3 +108,14 @@ def wrap[**P, R](func: Callable[P, R]) -> Callable[P, Awaitable[R]]:
         return await loop.run_in_executor(None, pfunc)
 
     return run
+
+
+async def to_thread[**P, R](func: Callable[P, R], /, *args: P.args, **kwargs: P.kwargs) -> R:
+    """Run func in the default executor, like asyncio.to_thread.
+
+    func always runs in a copy of the current context, so context variables it
+    sets don't leak into later calls on the same worker thread.
+    """
+    loop = get_running_loop()
+    call = partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await loop.run_in_executor(None, call)
@@ -3,18 +3,56 @@
 from __future__ import annotations
 
 import asyncio
+from collections import defaultdict
+from dataclasses import dataclass
 from typing import IO, TYPE_CHECKING, Any, Self
+from weakref import WeakKeyDictionary
 
+from fsspec.asyn import AsyncFileSystem
 from upath.extensions import ProxyUPath
 
+from upathtools.async_helpers import to_thread
+from upathtools.async_ops import get_async_fs
+
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Callable, Iterable, Mapping
 
-    from fsspec.asyn import AsyncFileSystem
+    from fsspec import AbstractFileSystem
     from upath.types import JoinablePathLike
 
 
+# Number of entries handed out by async iterators before yielding to the event loop
+_YIELD_EVERY = 256
+
+
+@dataclass(frozen=True, slots=True)
+class _FSCaps:
+    """Optional async operations a filesystem instance provides."""
+
+    touch: bool
+    rmdir: bool
+    open_async: bool
+
+
+_FS_CAPS: WeakKeyDictionary[AsyncFileSystem, _FSCaps] = WeakKeyDictionary()
+
+_ASYNC_FS: WeakKeyDictionary[AbstractFileSystem, AsyncFileSystem] = WeakKeyDictionary()
+"""Resolved async filesystem per sync filesystem, shared by all paths on it."""
+
+
+def _fs_caps(fs: AsyncFileSystem) -> _FSCaps:
+    """Get the (cached) capabilities of given filesystem."""
+    if (caps := _FS_CAPS.get(fs)) is None:
+        # Probe the instance, wrappers may delegate missing methods via __getattr__
+        caps = _FS_CAPS[fs] = _FSCaps(
+            touch=hasattr(fs, "_touch"),
+            rmdir=hasattr(fs, "_rmdir"),
+            open_async=type(fs).open_async is not AsyncFileSystem.open_async,
+        )
+    return caps
+
+
 class AsyncUPath(ProxyUPath):
     """UPath with async I/O capabilities.
 
@@ -26,11 +64,35 @@ class AsyncUPath(ProxyUPath):
     while adding async capabilities.
     """
 
-    async def afs(self) -> AsyncFileSystem:
-        """Get async filesystem instance when possible, otherwise wrapped sync fs."""
-        from upathtools.async_ops import get_async_fs
+    _cached_factory: Callable[[str], Self] | None
 
-        return await get_async_fs(self.fs)
+    async def afs(self) -> AsyncFileSystem:
+        """Get async filesystem instance when possible, otherwise wrapped sync fs.
+
+        The resolved filesystem is cached per sync filesystem, so children from
+        joinpath, aiterdir or aglob reuse it.
+        """
+        fs = self.fs
+        if (async_fs := _ASYNC_FS.get(fs)) is None:
+            async_fs = _ASYNC_FS[fs] = await get_async_fs(fs)
+        return async_fs
+
+    def _entry_factory(self) -> Callable[[str], Self]:
+        """Get a (cached) constructor for paths on the same filesystem as this one."""
+        if (cached := self.__dict__.get("_cached_factory")) is not None:
+            return cached
+        cls = type(self.__wrapped__)
+        protocol = self.protocol
+        storage_options = self.storage_options
+        from_upath = self._from_upath
+
+        # No return annotation: mypy can't bind Self in a nested function,
+        # the _cached_factory attribute carries the type instead
+        def factory(path: str):
+            return from_upath(cls(path, protocol=protocol, **storage_options))
+
+        self._cached_factory = factory
+        return factory
 
     async def aread_bytes(self) -> bytes:
         """Asynchronously read file content as bytes."""
@@ -72,6 +134,30 @@ class AsyncUPath(ProxyUPath):
         await fs._pipe_file(self.path, encoded_data)
         return len(data)
 
+    @classmethod
+    async def aread_many(cls, paths: Iterable[AsyncUPath]) -> dict[AsyncUPath, bytes]:
+        """Asynchronously read multiple files, batching the requests per filesystem."""
+        groups: defaultdict[Any, list[AsyncUPath]] = defaultdict(list)
+        for path in paths:
+            groups[path.fs].append(path)
+        result: dict[AsyncUPath, bytes] = {}
+        for group in groups.values():
+            fs = await group[0].afs()
+            contents = await fs._cat_ranges([p.path for p in group], None, None, on_error="raise")
+            for path, data in zip(group, contents, strict=True):
+                result[path] = data.encode("utf-8") if isinstance(data, str) else data
+        return result
+
+    @classmethod
+    async def awrite_many(cls, data: Mapping[AsyncUPath, bytes]) -> None:
+        """Asynchronously write multiple files, batching the requests per filesystem."""
+        groups: defaultdict[Any, list[AsyncUPath]] = defaultdict(list)
+        for path in data:
+            groups[path.fs].append(path)
+        for group in groups.values():
+            fs = await group[0].afs()
+            await fs._pipe({p.path: data[p] for p in group})
+
     async def aexists(self) -> bool:
         """Asynchronously check if path exists."""
         fs = await self.afs()
@@ -97,10 +183,10 @@ class AsyncUPath(ProxyUPath):
     async def atouch(self, exist_ok: bool = True) -> None:
         """Asynchronously create empty file or update timestamp."""
         fs = await self.afs()
-        if hasattr(fs, "_touch"):
+        if _fs_caps(fs).touch:
             await fs._touch(self.path, exist_ok=exist_ok)  # type: ignore
         else:
-            await asyncio.to_thread(self.touch, exist_ok=exist_ok)
+            await to_thread(self.touch, exist_ok=exist_ok)
 
     async def aunlink(self, missing_ok: bool = False) -> None:
         """Asynchronously remove file."""
@@ -109,58 +195,50 @@ class AsyncUPath(ProxyUPath):
 
     async def armdir(self) -> None:
         """Asynchronously remove directory."""
-        try:
-            fs = await self.afs()
-            if hasattr(fs, "_rmdir"):
-                await fs._rmdir(self.path)  # pyright: ignore[reportAttributeAccessIssue]
-            else:
-                await asyncio.to_thread(self.rmdir)
-        except Exception:  # noqa: BLE001
-            await asyncio.to_thread(self.rmdir)
+        fs = await self.afs()
+        if _fs_caps(fs).rmdir:
+            await fs._rmdir(self.path)  # pyright: ignore[reportAttributeAccessIssue]
+        else:
+            await to_thread(self.rmdir)
 
     async def aiterdir(self) -> AsyncIterator[Self]:
         """Asynchronously iterate over directory contents."""
         fs = await self.afs()
         entries = await fs._ls(self.path, detail=False)
-        for entry in entries:
-            if isinstance(entry, dict):
-                entry_path = entry.get("name", entry.get("path", ""))
-            else:
-                entry_path = str(entry)
-
-            if entry_path and entry_path != self.path:
-                yield self._from_upath(
-                    type(self.__wrapped__)(
-                        entry_path, protocol=self.protocol, **self.storage_options
-                    )
-                )
+        make = self._entry_factory()
+        self_path = self.path
+        # detail=False yields plain path strings
+        items = [
+            make(entry_path)
+            for entry_path in map(str, entries)
+            if entry_path and entry_path != self_path
+        ]
+        for i, item in enumerate(items, 1):
+            yield item
+            if not i % _YIELD_EVERY:  # let other tasks run during large listings
+                await asyncio.sleep(0)
 
     async def aglob(
         self, pattern: str, *, case_sensitive: bool | None = None
     ) -> AsyncIterator[Self]:
-        """Asynchronously glob for paths matching pattern."""
-        # TODO: deal with None
-        case_sensitive = case_sensitive or False
-        try:
-            fs = await self.afs()
-            full_pattern = str(self / pattern) if not pattern.startswith("/") else pattern
-            matches = await fs._glob(full_pattern)
-            for match_path in matches:
-                if isinstance(match_path, dict):
-                    match_path = match_path.get("name", match_path.get("path", ""))
-                yield self._from_upath(
-                    type(self.__wrapped__)(
-                        match_path, protocol=self.protocol, **self.storage_options
-                    )
-                )
-
-        except Exception:  # noqa: BLE001
-            # Final fallback to sync glob in thread
-            sync_matches = await asyncio.to_thread(
+        """Asynchronously glob for paths matching pattern.
+
+        fsspec globbing has no case_sensitive option, so passing one falls back
+        to the sync glob in a thread.
+        """
+        if case_sensitive is not None:
+            matched = await to_thread(
                 lambda: list(self.glob(pattern, case_sensitive=case_sensitive))
             )
-            for match in sync_matches:
-                yield match
+            for path in matched:
+                yield path
+            return
+        fs = await self.afs()
+        full_pattern = str(self / pattern) if not pattern.startswith("/") else pattern
+        matches = await fs._glob(full_pattern)
+        make = self._entry_factory()
+        for match_path in map(str, matches):
+            yield make(match_path)
 
     def arglob(self, pattern: str, *, case_sensitive: bool | None = None) -> AsyncIterator[Self]:
         """Asynchronously recursively glob for paths matching pattern."""
@@ -183,21 +261,17 @@ class AsyncUPath(ProxyUPath):
         newline: str | None = None,
         **kwargs: Any,
     ) -> IO:
-        """Asynchronously open file."""
-        try:
-            fs = await self.afs()
+        """Asynchronously open file.
 
-            return await fs.open_async(
-                self.path,
-                mode=mode,
-                buffering=buffering,
-                encoding=encoding,
-                errors=errors,
-                newline=newline,
-                **kwargs,
-            )
-        except Exception:  # noqa: BLE001
-            return await asyncio.to_thread(
+        Native async files are only used for binary modes, since backends like
+        AbstractAsyncStreamedFile don't support text modes. Everything else opens
+        the sync file in a thread.
+        """
+        fs = await self.afs()
+        text_options = (encoding, errors, newline)
+        binary = "b" in mode and all(option is None for option in text_options)
+        if not (binary and _fs_caps(fs).open_async):
+            return await to_thread(
                 self.open,
                 mode=mode,
                 buffering=buffering,
@@ -206,6 +280,10 @@ class AsyncUPath(ProxyUPath):
                 newline=newline,
                 **kwargs,
             )
+        # Async backends (aiofile, AsyncBufferedFile) don't accept the full open() signature
+        if buffering != -1:
+            kwargs["buffering"] = buffering
+        return await fs.open_async(self.path, mode=mode, **kwargs)
 
     async def acopy(self, target: JoinablePathLike, **kwargs: Any) -> AsyncUPath:
         """Asynchronously copy file to target location."""
@@ -215,10 +293,18 @@ class AsyncUPath(ProxyUPath):
             else target
         )
 
-        # Read source and write to target
+        fs = await self.afs()
+        if fs is await target_path.afs():
+            # Same filesystem: let the backend copy without routing data through us
+            try:
+                await fs._cp_file(self.path, target_path.path)
+            except NotImplementedError:
+                pass
+            else:
+                return target_path
+
         content = await self.aread_bytes()
         await target_path.awrite_bytes(content)
-
         return target_path
 
     async def amove(self, target: JoinablePathLike) -> AsyncUPath:
@@ -7,12 +7,18 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+import re
 import shlex
 from typing import TYPE_CHECKING, Any
 
+from upathtools.cli_ops import acat, adiff, adu, afind, agrep, ahead, als, atail, awc
+
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from upath import UPath
 
 SHORT_TO_LONG = {
@@ -33,6 +39,10 @@ SHORT_TO_LONG = {
     "f": "force",
     "p": "parents",
 }
+# Short flags that consume the following argument as their value
+VALUE_FLAGS = frozenset("nBAmdc")
+INT_PATTERN = re.compile(r"[-+]?\d+")
+FLOAT_PATTERN = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
 
 
 @dataclass
@@ -41,22 +51,112 @@ class CLIResult[TData]:
 
     data: TData
     command: str
+    _is_sequence: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._is_sequence = isinstance(self.data, Sequence)
 
     def __str__(self) -> str:
         """Format result as string."""
         if isinstance(self.data, list):
-            return "\n".join(str(item) for item in self.data)
+            return "\n".join(map(str, self.data))
         return str(self.data)
 
     def __iter__(self):
         """Allow iteration over results."""
-        if isinstance(self.data, Sequence):
-            yield from self.data
+        if self._is_sequence:
+            yield from self.data  # type: ignore[misc]
         else:
             yield self.data
 
 
-async def execute_cli_async(command: str, base: UPath) -> CLIResult:  # noqa: PLR0911
+async def _grep(args: list[str], kwargs: dict[str, Any], base: UPath) -> CLIResult:
+    if not args:
+        msg = "grep requires pattern argument"
+        raise ValueError(msg)
+    pattern = args[0]
+    path = args[1] if len(args) > 1 else "."
+    results = [result async for result in agrep(pattern, path, base, **kwargs)]
+    return CLIResult(results, f"grep {pattern} {path}")
+
+
+async def _find(args: list[str], kwargs: dict[str, Any], base: UPath) -> CLIResult:
+    path = args[0] if args else "."
+    # Map common find args
+    if "name" in args:
+        idx = args.index("name")
+        if idx + 1 < len(args):
+            kwargs["name"] = args[idx + 1]
+    results = [i async for i in afind(path, base, **kwargs)]
+    return CLIResult(results, f"find {path}")
+
+
+async def _head(args: list[str], kwargs: dict[str, Any], base: UPath) -> CLIResult:
+    if not args:
+        msg = "head requires file argument"
+        raise ValueError(msg)
+    result = await ahead(args[0], base, **kwargs)
+    return CLIResult(result, f"head {args[0]}")
+
+
+async def _tail(args: list[str], kwargs: dict[str, Any], base: UPath) -> CLIResult:
+    if not args:
+        msg = "tail requires file argument"
+        raise ValueError(msg)
+    result = await atail(args[0], base, **kwargs)
+    return CLIResult(result, f"tail {args[0]}")
+
+
+async def _cat(args: list[str], kwargs: dict[str, Any], base: UPath) -> CLIResult:
+    if not args:
+        msg = "cat requires file argument(s)"
+        raise ValueError(msg)
+    result = await acat(*args, base=base, **kwargs)
+    return CLIResult(result, f"cat {' '.join(args)}")
+
+
+async def _wc(args: list[str], kwargs: dict[str, Any], base: UPath) -> CLIResult:
+    if not args:
+        msg = "wc requires file argument"
+        raise ValueError(msg)
+    result = await awc(args[0], base, **kwargs)
+    return CLIResult(result, f"wc {args[0]}")
+
+
+async def _ls(args: list[str], kwargs: dict[str, Any], base: UPath) -> CLIResult:
+    path = args[0] if args else "."
+    result = await als(path, base, **kwargs)
+    return CLIResult(result, f"ls {path}")
+
+
+async def _du(args: list[str], kwargs: dict[str, Any], base: UPath) -> CLIResult:
+    path = args[0] if args else "."
+    result = await adu(path, base, **kwargs)
+    return CLIResult(result, f"du {path}")
+
+
+async def _diff(args: list[str], kwargs: dict[str, Any], base: UPath) -> CLIResult:
+    if len(args) < 2:  # noqa: PLR2004
+        msg = "diff requires two file arguments"
+        raise ValueError(msg)
+    result = await adiff(args[0], args[1], base, **kwargs)
+    return CLIResult(result, f"diff {args[0]} {args[1]}")
+
+
+COMMANDS: dict[str, Callable[[list[str], dict[str, Any], UPath], Awaitable[CLIResult]]] = {
+    "grep": _grep,
+    "find": _find,
+    "head": _head,
+    "tail": _tail,
+    "cat": _cat,
+    "wc": _wc,
+    "ls": _ls,
+    "du": _du,
+    "diff": _diff,
+}
+
+
+async def execute_cli_async(command: str, base: UPath) -> CLIResult:
     """Execute a CLI-style command on a filesystem/path asynchronously.
 
     Args:
@@ -72,85 +172,13 @@ async def execute_cli_async(command: str, base: UPath) -> CLIResult:  # noqa: PL
         >>> for match in result:
         ...     print(match)
     """
-    from upathtools.cli_ops import acat, adiff, adu, afind, agrep, ahead, als, atail, awc
-
-    parts = shlex.split(command)
-    if not parts:
-        msg = "Empty command"
+    cmd, args, kwargs = _parse_command(command)
+    handler = COMMANDS.get(cmd)
+    if handler is None:
+        msg = f"Unknown command: {cmd}"
         raise ValueError(msg)
-
-    cmd = parts[0]
-    args, kwargs = _parse_args(parts[1:])
-
-    match cmd:
-        case "grep":
-            if len(args) < 1:
-                msg = "grep requires pattern argument"
-                raise ValueError(msg)
-
-            path = args[1] if len(args) > 1 else "."
-            grep_results = [result async for result in agrep(cmd, path, base, **kwargs)]
-            return CLIResult(grep_results, f"grep {cmd} {path}")
-        case "find":
-            path = args[0] if args else "."
-
-            # Map common find args
-            if "name" in args:
-                idx = args.index("name")
-                if idx + 1 < len(args):
-                    kwargs["name"] = args[idx + 1]
-
-            find_results = [i async for i in afind(path, base, **kwargs)]
-            return CLIResult(find_results, f"find {path}")
-        case "head":
-            if not args:
-                msg = "head requires file argument"
-                raise ValueError(msg)
-
-            result = await ahead(cmd, base, **kwargs)
-            return CLIResult(result, f"head {cmd}")
-        case "tail":
-            if not args:
-                msg = "tail requires file argument"
-                raise ValueError(msg)
-
-            result = await atail(cmd, base, **kwargs)
-            return CLIResult(result, f"tail {cmd}")
-
-        case "cat":
-            if not args:
-                msg = "cat requires file argument(s)"
-                raise ValueError(msg)
-
-            result = await acat(*args, base=base, **kwargs)
-            return CLIResult(result, f"cat {' '.join(args)}")
-
-        case "wc":
-            if not args:
-                msg = "wc requires file argument"
-                raise ValueError(msg)
-
-            result = await awc(cmd, base, **kwargs)
-            return CLIResult(result, f"wc {cmd}")
-
-        case "ls":
-            path = cmd if args else "."
-            ls_results = await als(path, base, **kwargs)
-            return CLIResult(ls_results, f"ls {path}")
-        case "du":
-            path = cmd if args else "."
-            du_results = await adu(path, base, **kwargs)
-            return CLIResult(du_results, f"du {path}")
-        case "diff":
-            if len(args) < 2:  # noqa: PLR2004
-                msg = "diff requires two file arguments"
-                raise ValueError(msg)
-
-            result = await adiff(cmd, args[1], base, **kwargs)
-            return CLIResult(result, f"diff {cmd} {args[1]}")
-        case _:
-            msg = f"Unknown command: {cmd}"
-            raise ValueError(msg)
+    # Handlers may mutate their arguments, so never hand out the cached objects
+    return await handler(list(args), dict(kwargs), base)
 
 
 def execute_cli(command: str, base: UPath) -> CLIResult:
@@ -158,6 +186,17 @@ def execute_cli(command: str, base: UPath) -> CLIResult:
     return asyncio.run(execute_cli_async(command, base))
 
 
+@lru_cache(maxsize=256)
+def _parse_command(command: str) -> tuple[str, tuple[str, ...], tuple[tuple[str, Any], ...]]:
+    """Split a command string into command name, positional args and flag items."""
+    parts = shlex.split(command)
+    if not parts:
+        msg = "Empty command"
+        raise ValueError(msg)
+    args, kwargs = _parse_args(parts[1:])
+    return parts[0], tuple(args), tuple(kwargs.items())
+
+
 def _parse_args(args: list[str]) -> tuple[list[str], dict[str, Any]]:
     """Parse positional args and flags from command arguments.
 
@@ -169,9 +208,11 @@ def _parse_args(args: list[str]) -> tuple[list[str], dict[str, Any]]:
     """
     positional: list[str] = []
     kwargs: dict[str, Any] = {}
+    short_to_long = SHORT_TO_LONG.get
+    n = len(args)
     i = 0
 
-    while i < len(args):
+    while i < n:
         arg = args[i]
 
         if arg.startswith("--"):
@@ -180,7 +221,7 @@ def _parse_args(args: list[str]) -> tuple[list[str], dict[str, Any]]:
             if "=" in key:
                 k, v = key.split("=", 1)
                 kwargs[k] = _parse_value(v)
-            elif i + 1 < len(args) and not args[i + 1].startswith("-"):
+            elif i + 1 < n and not args[i + 1].startswith("-"):
                 kwargs[key] = _parse_value(args[i + 1])
                 i += 1
             else:
@@ -188,9 +229,9 @@ def _parse_args(args: list[str]) -> tuple[list[str], dict[str, Any]]:
         elif arg.startswith("-") and len(arg) > 1:
             # Short options
             for char in arg[1:]:
-                flag_name = SHORT_TO_LONG.get(char, char)
+                flag_name = short_to_long(char, char)
                 # Check if next arg is a value for this flag
-                if char in "nBAmdc" and i + 1 < len(args) and not args[i + 1].startswith("-"):
+                if char in VALUE_FLAGS and i + 1 < n and not args[i + 1].startswith("-"):
                     kwargs[flag_name] = _parse_value(args[i + 1])
                     i += 1
                 else:
@@ -205,16 +246,13 @@ def _parse_args(args: list[str]) -> tuple[list[str], dict[str, Any]]:
 
 def _parse_value(value: str) -> Any:
     """Parse a string value to appropriate type."""
-    if value.lower() == "true":
+    lowered = value.lower()
+    if lowered == "true":
         return True
-    if value.lower() == "false":
+    if lowered == "false":
         return False
-    try:
+    if INT_PATTERN.fullmatch(value):
         return int(value)
-    except ValueError:
-        pass
-    try:
+    if FLOAT_PATTERN.fullmatch(value):
         return float(value)
-    except ValueError:
-        pass
     return value
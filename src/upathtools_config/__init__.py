@@ -6,7 +6,7 @@ For the actual filesystems, use `from upathtools import ...`.
 
 from typing import Annotated
 
-from pydantic import Field
+from pydantic import ConfigDict, Field, TypeAdapter
 
 from upathtools_config.base import (
     FileSystemConfig,
@@ -22,6 +22,7 @@ from upathtools_config.custom_fs_configs import (
     CustomFilesystemConfig,
     DistributionFilesystemConfig,
     FlatUnionFilesystemConfig,
+    HttpBasedConfig,
     HttpFilesystemConfig,
     HttpxFilesystemConfig,
     MountsFilesystemConfig,
@@ -97,7 +98,13 @@ FilesystemConfigType = Annotated[
     Field(discriminator="type"),
 ]
 
+CONFIG_ADAPTER: TypeAdapter[FilesystemConfigType] = TypeAdapter(
+    FilesystemConfigType, config=ConfigDict(defer_build=True)
+)
+"""Shared validator for the filesystem config union, dispatching on "type"."""
+
 __all__ = [
+    "CONFIG_ADAPTER",
     # Remote
     "AppwriteFilesystemConfig",
     # Fsspec
@@ -132,6 +139,7 @@ __all__ = [
     "GitLabFilesystemConfig",
     "GithubFilesystemConfig",
     "HadoopFilesystemConfig",
+    "HttpBasedConfig",
     "HttpFilesystemConfig",
     "HttpxFilesystemConfig",
     "HuggingFaceFilesystemConfig",
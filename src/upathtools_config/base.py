@@ -2,18 +2,26 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, ClassVar, Literal, overload
+import codecs
+from collections.abc import Callable
+from functools import cache, lru_cache
+import json
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Annotated, Any, ClassVar, Literal, get_args, overload
 from urllib.parse import urlparse
 
-import fsspec
+from fsspec import filesystem
 from fsspec.implementations.cached import WholeFileCacheFileSystem
-from pydantic import AnyUrl, BaseModel, ConfigDict, Field, SecretStr
+from fsspec.implementations.dirfs import DirFileSystem
+from pydantic import AfterValidator, AnyUrl, BaseModel, ConfigDict, Field, SecretStr
 from upath import UPath
 
 from upathtools.async_ops import to_async_fs
 
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from fsspec import AbstractFileSystem
     from fsspec.asyn import AsyncFileSystem
 
@@ -23,11 +31,68 @@ FilesystemCategoryType = Literal[
     "base", "archive", "transform", "aggregation", "wrapper", "sandbox"
 ]
 
+# Field patterns shared between config classes
+IMPORT_PATH_PATTERN = r"^[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-9_]*)*$"
+"""Dotted Python import paths."""
+GITHUB_NAME_PATTERN = r"^[a-zA-Z0-9]([a-zA-Z0-9\-])*[a-zA-Z0-9]$|^[a-zA-Z0-9]$"
+"""GitHub user and organization names."""
+REPO_NAME_PATTERN = r"^[a-zA-Z0-9\._\-]+$"
+"""GitHub repository names."""
+USERNAME_PATTERN = r"^[a-zA-Z0-9._-]+$"
+"""Generic login names for network filesystems."""
+HEX_PATTERN = r"^[a-f0-9]+$"
+"""Lowercase hex identifiers (commit SHAs, gist IDs)."""
+
+
+def _check_encoding(value: str) -> str:
+    """Make sure given name refers to a codec known to Python."""
+    try:
+        codecs.lookup(value)
+    except LookupError:
+        msg = f"Unknown encoding: {value!r}"
+        raise ValueError(msg) from None
+    return value
+
+
+Encoding = Annotated[str, AfterValidator(_check_encoding)]
+"""Codec names such as utf-8 or latin_1."""
+
+
+def _get_converter(annotation: Any) -> Callable[[Any], Any] | None:
+    """Get the function turning values of given field type into plain fsspec kwargs."""
+    types = get_args(annotation) or (annotation,)
+    if SecretStr in types:
+        return SecretStr.get_secret_value
+    if AnyUrl in types:
+        return str
+    return None
+
+
+ConfigClass = type["FileSystemConfig"]
+"""A FileSystemConfig subclass (spelled here since `type` is a field inside the class)."""
+
+
+@lru_cache(maxsize=1024)
+def _parse_uri(uri: str) -> tuple[str, str]:
+    """Split a URI into protocol and filesystem path."""
+    if ":" not in uri or (uri[1:2] == ":" and uri[:1].isalpha()):
+        # Plain local path (or Windows drive path), nothing to parse
+        return "file", uri
+    parsed = urlparse(uri)
+    protocol = parsed.scheme or "file"
+    # Build path from URI (handle file:// specially)
+    if protocol == "file":
+        return "file", parsed.path
+    # For remote protocols, include netloc + path
+    return protocol, f"{parsed.netloc}{parsed.path}" if parsed.netloc else parsed.path
+
 
 class FileSystemConfig(BaseModel):
     """Base configuration for filesystem implementations."""
 
-    model_config = ConfigDict(extra="allow", use_attribute_docstrings=True)
+    model_config = ConfigDict(
+        extra="allow", use_attribute_docstrings=True, defer_build=True, frozen=True
+    )
 
     type: str
     """Type of filesystem"""
@@ -45,11 +110,121 @@ class FileSystemConfig(BaseModel):
     _category: ClassVar[FilesystemCategoryType] = "base"
     """Classification of the filesystem type"""
 
+    _registry: ClassVar[dict[str, ConfigClass]] = {}
+    """Mapping of filesystem type to config class, filled as subclasses are defined.
+
+    A subclass keeping the type of a registered config replaces it, so narrowed
+    user configs are picked up. Unrelated classes can't claim a registered type.
+    """
+
+    _category_registry: ClassVar[dict[str, list[ConfigClass]]] = {}
+    """Registered config classes grouped by their category."""
+
+    _field_converters: ClassVar[dict[str, Callable[[Any], Any]]] = {}
+    """Converters for fields whose values need unwrapping before passing them to fsspec."""
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        # Runs once the model is complete, so field defaults and annotations are resolved
+        super().__pydantic_init_subclass__(**kwargs)
+        fs_type = cls.model_fields["type"].default
+        if isinstance(fs_type, str):
+            if registered := FileSystemConfig._registry.get(fs_type):
+                if not issubclass(cls, registered):
+                    msg = f"Filesystem type {fs_type!r} is already registered by {registered}"
+                    raise TypeError(msg)
+                FileSystemConfig._category_registry[registered._category].remove(registered)
+            FileSystemConfig._registry[fs_type] = cls
+            FileSystemConfig._category_registry.setdefault(cls._category, []).append(cls)
+        cls._field_converters = {
+            name: converter
+            for name, field in cls.model_fields.items()
+            if (converter := _get_converter(field.annotation))
+        }
+
+    @classmethod
+    def get_available_configs(cls) -> Mapping[str, ConfigClass]:
+        """Get all config classes deriving from FileSystemConfig, keyed by type.
+
+        Returns a read-only view, the registry is only filled by subclass definitions.
+        """
+        return MappingProxyType(FileSystemConfig._registry)
+
+    @classmethod
+    def get_configs_by_category(cls, category: FilesystemCategoryType) -> list[ConfigClass]:
+        """Get all registered config classes of given category."""
+        return list(FileSystemConfig._category_registry.get(category, ()))
+
+    @classmethod
+    @cache
+    def get_json_schema(cls) -> dict[str, Any]:
+        """Get the JSON schema of this config class.
+
+        Generated once per class and shared between callers, so don't modify it.
+        """
+        return cls.model_json_schema()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> FileSystemConfig:
+        """Create the config matching the "type" key of given data.
+
+        Unknown types fall back to the class this is called on.
+        """
+        if (fs_type := data.get("type")) is None:
+            msg = "Filesystem config is missing the 'type' key"
+            raise ValueError(msg)
+        return FileSystemConfig._registry.get(fs_type, cls).model_validate(data)
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> FileSystemConfig:
+        """Create the config matching the "type" key of given data without validation.
+
+        Only meant for already validated field values, like the ones of an
+        existing config (``dict(config)``). Values are neither coerced nor checked,
+        so raw user input should go through `from_dict` instead.
+
+        Raises:
+            ValueError: If the "type" key is missing or names no registered config.
+        """
+        if (fs_type := data.get("type")) is None:
+            msg = "Filesystem config is missing the 'type' key"
+            raise ValueError(msg)
+        config_cls: ConfigClass | None = FileSystemConfig._registry.get(fs_type)
+        if config_cls is None:
+            msg = f"Unknown filesystem config type: {fs_type!r}"
+            raise ValueError(msg)
+        return config_cls.model_construct(**data)
+
+    def __hash__(self) -> int:
+        """Hash the serialized config, so configs can key caches of filesystems.
+
+        The default hash of frozen models fails for dict fields like target_options.
+        Keys are sorted, since equal configs may hold dicts in different key order.
+        """
+        return hash(json.dumps(self.model_dump(mode="json", fallback=repr), sort_keys=True))
+
     @property
     def category(self) -> FilesystemCategoryType:
         """Get the category of this filesystem."""
         return self._category
 
+    def _get_fs_kwargs(self) -> dict[str, Any]:
+        """Get the filesystem constructor kwargs from the fields of this config.
+
+        Values are read straight from the instance instead of going through
+        model_dump, which would also serialize them (turning UPath fields into dicts).
+        """
+        fs_kwargs = {
+            key: value
+            for fields in (self.__dict__, self.__pydantic_extra__ or {})
+            for key, value in fields.items()
+            if value is not None and key not in {"type", "root_path", "cached"}
+        }
+        for key, convert in self._field_converters.items():
+            if key in fs_kwargs:
+                fs_kwargs[key] = convert(fs_kwargs[key])
+        return fs_kwargs
+
     @overload
     def create_fs(self, ensure_async: Literal[False] = ...) -> AbstractFileSystem: ...
 
@@ -62,18 +237,9 @@ class FileSystemConfig(BaseModel):
         Returns:
             Instantiated filesystem with the proper configuration.
         """
-        from fsspec.implementations.dirfs import DirFileSystem
-
         from upathtools import core
 
-        fs_kwargs = self.model_dump(exclude={"type", "root_path", "cached"}, exclude_none=True)
-        for key, value in fs_kwargs.items():
-            if isinstance(value, SecretStr):
-                fs_kwargs[key] = value.get_secret_value()
-            elif isinstance(value, AnyUrl):
-                fs_kwargs[key] = str(value)
-
-        fs = core.filesystem(self.type, **fs_kwargs)
+        fs = core.filesystem(self.type, **self._get_fs_kwargs())
         # Apply path prefix (DirFileSystem wrapper) - sandboxed, can't escape
         if self.root_path:
             fs = DirFileSystem(path=self.root_path, fs=fs)
@@ -147,22 +313,12 @@ class URIFileSystemConfig(FileSystemConfig):
 
         ensure_async: If True, ensure the filesystem is async.
         """
-        # Parse protocol from URI
-        parsed = urlparse(self.uri)
-        protocol = parsed.scheme or "file"
-
-        # Build path from URI (handle file:// specially)
-        if protocol == "file":
-            path = parsed.path
-        else:
-            # For remote protocols, include netloc + path
-            path = f"{parsed.netloc}{parsed.path}" if parsed.netloc else parsed.path
-
-        fs = fsspec.filesystem(protocol, **self.storage_options)
+        protocol, path = _parse_uri(self.uri)
+        fs = filesystem(protocol, **self.storage_options)
         # Apply root_path restriction if set, otherwise use URI path
         effective_root = self.root_path or path
         if effective_root:
-            fs = fsspec.filesystem("dir", path=effective_root, fs=fs)
+            fs = DirFileSystem(path=effective_root, fs=fs)
         if self.cached:
             fs = WholeFileCacheFileSystem(fs=fs)
         if ensure_async:
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Any, ClassVar, Literal
+from typing import Annotated, Any, ClassVar, Literal
 
 from pydantic import ConfigDict, Field
 from upath import UPath  # noqa: TC002
 
 from upathtools_config.base import (
-    FilesystemCategoryType,  # noqa: TC001
+    IMPORT_PATH_PATTERN,
+    Encoding,
+    FilesystemCategoryType,
     FileSystemConfig,
 )
 
@@ -26,11 +28,10 @@ class CliFilesystemConfig(FileSystemConfig):
     shell: bool = Field(default=False, title="Shell mode")
     """Whether to use shell mode for command execution"""
 
-    encoding: str = Field(
+    encoding: Encoding = Field(
         default="utf-8",
         title="Output encoding",
         examples=["utf-8"],
-        pattern=r"^[a-zA-Z0-9]([a-zA-Z0-9\-_])*$",
     )
     """Output encoding for command results"""
 
@@ -62,15 +63,12 @@ class FlatUnionFilesystemConfig(FileSystemConfig):
     """List of filesystem identifiers to include in the union"""
 
 
-class HttpFilesystemConfig(FileSystemConfig):
-    """Configuration for HTTP filesystem."""
-
-    model_config = ConfigDict(json_schema_extra={"title": "HTTP Configuration"})
-
-    type: Literal["http"] = Field("http", init=False)
-    """HTTP filesystem type"""
+class HttpBasedConfig(FileSystemConfig):
+    """Base configuration for HTTP filesystems.
 
-    _category: ClassVar[FilesystemCategoryType] = "base"
+    Provides the link handling and caching fields shared by the
+    fsspec and HTTPX based implementations.
+    """
 
     simple_links: bool = Field(default=True, title="Simple Links")
     """Whether to extract links using simpler regex patterns"""
@@ -81,7 +79,9 @@ class HttpFilesystemConfig(FileSystemConfig):
     same_scheme: bool = Field(default=True, title="Same Scheme")
     """Whether to keep the same scheme (http/https) when following links"""
 
-    size_policy: str | None = Field(default=None, title="Size Policy", examples=["head", "get"])
+    size_policy: Literal["head", "get"] | None = Field(
+        default=None, title="Size Policy", examples=["head", "get"]
+    )
     """Policy for determining file size ('head' or 'get')"""
 
     cache_type: str = Field(
@@ -93,6 +93,17 @@ class HttpFilesystemConfig(FileSystemConfig):
     """Whether URLs are already encoded"""
 
 
+class HttpFilesystemConfig(HttpBasedConfig):
+    """Configuration for HTTP filesystem."""
+
+    model_config = ConfigDict(json_schema_extra={"title": "HTTP Configuration"})
+
+    type: Literal["http"] = Field("http", init=False)
+    """HTTP filesystem type"""
+
+    _category: ClassVar[FilesystemCategoryType] = "base"
+
+
 class PackageFilesystemConfig(FileSystemConfig):
     """Configuration for Package filesystem."""
 
@@ -106,8 +117,7 @@ class PackageFilesystemConfig(FileSystemConfig):
     package: str = Field(
         title="Package Name",
         examples=["upathtools"],
-        pattern=r"^[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-9_]*)*$",
-        min_length=1,
+        pattern=IMPORT_PATH_PATTERN,
     )
     """Name of the package to browse"""
 
@@ -139,13 +149,12 @@ class BaseModelFilesystemConfig(FileSystemConfig):
     model: str = Field(
         title="Model Import Path",
         examples=["mypackage.MyModel", "pydantic.BaseModel"],
-        pattern=r"^[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-9_]*)*$",
-        min_length=1,
+        pattern=IMPORT_PATH_PATTERN,
     )
     """BaseModel class import path"""
 
 
-class HttpxFilesystemConfig(FileSystemConfig):
+class HttpxFilesystemConfig(HttpBasedConfig):
     """Configuration for HTTPX-based HTTP filesystem."""
 
     model_config = ConfigDict(json_schema_extra={"title": "HTTPX Configuration"})
@@ -155,26 +164,6 @@ class HttpxFilesystemConfig(FileSystemConfig):
 
     _category: ClassVar[FilesystemCategoryType] = "base"
 
-    simple_links: bool = Field(default=True, title="Simple Links")
-    """Whether to extract links using simpler regex patterns"""
-
-    block_size: int | None = Field(default=None, gt=0, title="Block Size", examples=[8192, 65536])
-    """Block size for reading files in chunks"""
-
-    same_scheme: bool = Field(default=True, title="Same Scheme")
-    """Whether to keep the same scheme (http/https) when following links"""
-
-    size_policy: str | None = Field(default=None, title="Size Policy", examples=["head", "get"])
-    """Policy for determining file size ('head' or 'get')"""
-
-    cache_type: str = Field(
-        default="bytes", title="Cache Type", examples=["bytes", "readahead", "blockcache"]
-    )
-    """Type of cache to use for file contents"""
-
-    encoded: bool = Field(default=False, title="Encoded URLs")
-    """Whether URLs are already encoded"""
-
     timeout: int | None = Field(default=None, ge=0, title="Request Timeout", examples=[30, 60, 120])
     """HTTP request timeout in seconds"""
 
@@ -210,8 +199,7 @@ class BaseModelInstanceFilesystemConfig(FileSystemConfig):
     instance: str = Field(
         title="Model Instance Path",
         examples=["mypackage.model_instance", "app.config.settings"],
-        pattern=r"^[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-9_]*)*$",
-        min_length=1,
+        pattern=IMPORT_PATH_PATTERN,
     )
     """BaseModel instance import path"""
 
@@ -308,22 +296,8 @@ class MountsFilesystemConfig(FileSystemConfig):
     @staticmethod
     def _get_config_class(fs_type: str) -> type[FileSystemConfig]:  # type: ignore[valid-type]
         """Get the config class for a filesystem type."""
-        # Import here to avoid circular imports
-        # Get all config types from the union
-        import typing
-
-        from upathtools_config import FilesystemConfigType
-
-        args = typing.get_args(FilesystemConfigType)
-        # First arg is the actual union, get its args
-        if args:
-            union_args = typing.get_args(args[0]) if typing.get_args(args[0]) else [args[0]]
-            for config_cls in union_args:
-                if hasattr(config_cls, "model_fields") and "type" in config_cls.model_fields:
-                    field = config_cls.model_fields["type"]
-                    if field.default == fs_type:
-                        return config_cls
-
+        if config_cls := FileSystemConfig.get_available_configs().get(fs_type):
+            return config_cls
         msg = f"Unknown filesystem type: {fs_type}"
         raise ValueError(msg)
 
@@ -369,7 +343,7 @@ class OverlayFilesystemConfig(FileSystemConfig):
 #     """Directory containing skill definitions"""
 
 
-CustomFilesystemConfig = (
+CustomFilesystemConfig = Annotated[
     AsyncLocalFilesystemConfig
     | BaseModelFilesystemConfig
     | BaseModelInstanceFilesystemConfig
@@ -382,6 +356,7 @@ CustomFilesystemConfig = (
     | OverlayFilesystemConfig
     | PackageFilesystemConfig
     | SkillsFilesystemConfig
-    | UnionFilesystemConfig
-)
+    | UnionFilesystemConfig,
+    Field(discriminator="type"),
+]
 """Union of all custom filesystem configurations."""
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, ClassVar, Literal
+from typing import Annotated, Any, ClassVar, Literal
 
 from pydantic import ConfigDict, Field
 from upath import UPath  # noqa: TC002
@@ -133,11 +133,12 @@ class TreeSitterFilesystemConfig(FileBasedConfig):
     """Programming language (auto-detected from extension if not specified)"""
 
 
-FileBasedFilesystemConfig = (
+FileBasedFilesystemConfig = Annotated[
     JsonSchemaFilesystemConfig
     | MarkdownFilesystemConfig
     | OpenApiFilesystemConfig
     | SqliteFilesystemConfig
-    | TreeSitterFilesystemConfig
-)
+    | TreeSitterFilesystemConfig,
+    Field(discriminator="type"),
+]
 """Union of all file-based filesystem configurations."""
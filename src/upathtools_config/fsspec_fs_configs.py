@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, ClassVar, Literal
+from typing import TYPE_CHECKING, Annotated, Any, ClassVar, Literal
 
 from pydantic import AnyUrl, ConfigDict, Field, SecretStr
 from upath import UPath  # noqa: TC002
 
-from upathtools_config.base import FilesystemCategoryType, FileSystemConfig  # noqa: TC001
+from upathtools_config.base import (
+    GITHUB_NAME_PATTERN,
+    REPO_NAME_PATTERN,
+    USERNAME_PATTERN,
+    Encoding,
+    FilesystemCategoryType,
+    FileSystemConfig,
+)
+from upathtools_config.file_based_fs_configs import FileBasedConfig
 
 
 if TYPE_CHECKING:
@@ -82,8 +90,7 @@ class FTPFilesystemConfig(FileSystemConfig):
         default=None,
         title="Username",
         examples=["user123", "admin"],
-        pattern=r"^[a-zA-Z0-9._-]+$",
-        min_length=1,
+        pattern=USERNAME_PATTERN,
         max_length=32,
     )
     """Username for authentication"""
@@ -103,11 +110,10 @@ class FTPFilesystemConfig(FileSystemConfig):
     timeout: int = Field(default=30, ge=0, title="Timeout", examples=[30, 60, 120])
     """Connection timeout in seconds"""
 
-    encoding: str = Field(
+    encoding: Encoding = Field(
         default="utf-8",
         title="Encoding",
         examples=["utf-8", "latin-1"],
-        pattern=r"^[a-zA-Z0-9]([a-zA-Z0-9\-_])*$",
     )
     """Encoding for filenames and directories"""
 
@@ -158,8 +164,7 @@ class GithubFilesystemConfig(FileSystemConfig):
     org: str = Field(
         title="Organization",
         examples=["microsoft", "facebook", "phil65"],
-        pattern=r"^[a-zA-Z0-9]([a-zA-Z0-9\-])*[a-zA-Z0-9]$|^[a-zA-Z0-9]$",
-        min_length=1,
+        pattern=GITHUB_NAME_PATTERN,
         max_length=39,
     )
     """GitHub organization or user name"""
@@ -167,8 +172,7 @@ class GithubFilesystemConfig(FileSystemConfig):
     repo: str = Field(
         title="Repository",
         examples=["vscode", "react", "upathtools"],
-        pattern=r"^[a-zA-Z0-9\._\-]+$",
-        min_length=1,
+        pattern=REPO_NAME_PATTERN,
         max_length=100,
     )
     """Repository name"""
@@ -186,8 +190,7 @@ class GithubFilesystemConfig(FileSystemConfig):
         default=None,
         title="GitHub Username",
         examples=["octocat", "phil65"],
-        pattern=r"^[a-zA-Z0-9]([a-zA-Z0-9\-])*[a-zA-Z0-9]$|^[a-zA-Z0-9]$",
-        min_length=1,
+        pattern=GITHUB_NAME_PATTERN,
         max_length=39,
     )
     """GitHub username for authentication"""
@@ -225,8 +228,7 @@ class HadoopFilesystemConfig(FileSystemConfig):
         default=None,
         title="HDFS User",
         examples=["hdfs", "hadoop", "admin"],
-        pattern=r"^[a-zA-Z0-9._-]+$",
-        min_length=1,
+        pattern=USERNAME_PATTERN,
         max_length=64,
     )
     """Username to connect as"""
@@ -263,7 +265,7 @@ class JupyterFilesystemConfig(FileSystemConfig):
     """Jupyter authentication token"""
 
 
-class LibArchiveFilesystemConfig(FileSystemConfig):
+class LibArchiveFilesystemConfig(FileBasedConfig):
     """Configuration for LibArchive filesystem."""
 
     model_config = ConfigDict(json_schema_extra={"title": "LibArchive Configuration"})
@@ -276,14 +278,6 @@ class LibArchiveFilesystemConfig(FileSystemConfig):
     fo: UPath = Field(title="Archive Path", examples=["/path/to/archive.tar.gz"])
     """Path to archive file"""
 
-    target_protocol: str | None = Field(
-        default=None, title="Target Protocol", examples=["file", "s3", "http"]
-    )
-    """Protocol for source file"""
-
-    target_options: dict[str, Any] | None = Field(default=None, title="Target Protocol Options")
-    """Options for target protocol"""
-
     block_size: int | None = Field(default=None, gt=0, title="Block Size", examples=[8192, 65536])
     """Block size for read operations"""
 
@@ -338,8 +332,7 @@ class SFTPFilesystemConfig(FileSystemConfig):
         default=None,
         title="Username",
         examples=["user", "admin"],
-        pattern=r"^[a-zA-Z0-9._-]+$",
-        min_length=1,
+        pattern=USERNAME_PATTERN,
         max_length=32,
     )
     """Username for authentication"""
@@ -374,8 +367,7 @@ class SMBFilesystemConfig(FileSystemConfig):
         default=None,
         title="Username",
         examples=["user", "admin"],
-        pattern=r"^[a-zA-Z0-9._-]+$",
-        min_length=1,
+        pattern=USERNAME_PATTERN,
         max_length=32,
     )
     """Username for authentication"""
@@ -392,7 +384,7 @@ class SMBFilesystemConfig(FileSystemConfig):
     """Number of retries for session registration"""
 
 
-class TarFilesystemConfig(FileSystemConfig):
+class TarFilesystemConfig(FileBasedConfig):
     """Configuration for Tar archive filesystem."""
 
     model_config = ConfigDict(json_schema_extra={"title": "TAR Archive Configuration"})
@@ -408,14 +400,6 @@ class TarFilesystemConfig(FileSystemConfig):
     index_store: Any | None = Field(default=None, title="Index Store")
     """Where to store the index"""
 
-    target_options: dict[str, Any] | None = Field(default=None, title="Target Protocol Options")
-    """Options for target protocol"""
-
-    target_protocol: str | None = Field(
-        default=None, title="Target Protocol", examples=["file", "s3", "http"]
-    )
-    """Protocol for source file"""
-
     compression: str | None = Field(
         default=None,
         title="Compression Type",
@@ -447,8 +431,7 @@ class WebHDFSFilesystemConfig(FileSystemConfig):
         default=None,
         title="HDFS User",
         examples=["hdfs", "hadoop", "admin"],
-        pattern=r"^[a-zA-Z0-9._-]+$",
-        min_length=1,
+        pattern=USERNAME_PATTERN,
         max_length=64,
     )
     """Username for authentication"""
@@ -468,7 +451,7 @@ class WebHDFSFilesystemConfig(FileSystemConfig):
     """Verify SSL certificates"""
 
 
-class ZipFilesystemConfig(FileSystemConfig):
+class ZipFilesystemConfig(FileBasedConfig):
     """Configuration for Zip archive filesystem."""
 
     model_config = ConfigDict(json_schema_extra={"title": "ZIP Archive Configuration"})
@@ -484,14 +467,6 @@ class ZipFilesystemConfig(FileSystemConfig):
     mode: str = Field(default="r", title="Open Mode", examples=["r", "w", "a"], pattern=r"^[rwa]$")
     """Open mode ('r', 'w', 'a')"""
 
-    target_protocol: str | None = Field(
-        default=None, title="Target Protocol", examples=["file", "s3", "http"]
-    )
-    """Protocol for source file"""
-
-    target_options: dict[str, Any] | None = Field(default=None, title="Target Protocol Options")
-    """Options for target protocol"""
-
     compression: int = Field(
         default=0, ge=0, le=99, title="Compression Method", examples=[0, 8]
     )  # ZipFile.ZIP_STORED
@@ -687,7 +662,7 @@ class WebdavFilesystemConfig(FileSystemConfig):
     """Connection timeout in seconds"""
 
 
-FsspecFilesystemConfig = (
+FsspecFilesystemConfig = Annotated[
     ArrowFilesystemConfig
     | AzureBlobFilesystemConfig
     | DataFilesystemConfig
@@ -708,6 +683,7 @@ FsspecFilesystemConfig = (
     | TarFilesystemConfig
     | WebdavFilesystemConfig
     | WebHDFSFilesystemConfig
-    | ZipFilesystemConfig
-)
+    | ZipFilesystemConfig,
+    Field(discriminator="type"),
+]
 """Union of all fsspec-based filesystem configurations."""
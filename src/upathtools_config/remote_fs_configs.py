@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar, Literal
+from typing import TYPE_CHECKING, Annotated, ClassVar, Literal
 
 from pydantic import ConfigDict, Field, SecretStr
 
 from upathtools_config.base import (
+    GITHUB_NAME_PATTERN,
+    HEX_PATTERN,
+    REPO_NAME_PATTERN,
     FilesystemCategoryType,  # noqa: TC001
     FileSystemConfig,
 )
@@ -30,8 +33,7 @@ class GistFilesystemConfig(FileSystemConfig):
         default=None,
         title="Gist ID",
         examples=["abc123"],
-        pattern=r"^[a-f0-9]+$",
-        min_length=1,
+        pattern=HEX_PATTERN,
     )
     """Specific gist ID to access"""
 
@@ -39,8 +41,7 @@ class GistFilesystemConfig(FileSystemConfig):
         default=None,
         title="GitHub Username",
         examples=["phil65"],
-        pattern=r"^[a-zA-Z0-9]([a-zA-Z0-9\-])*[a-zA-Z0-9]$|^[a-zA-Z0-9]$",
-        min_length=1,
+        pattern=GITHUB_NAME_PATTERN,
         max_length=39,
     )
     """GitHub username for listing all gists"""
@@ -52,8 +53,7 @@ class GistFilesystemConfig(FileSystemConfig):
         default=None,
         title="Gist Revision",
         examples=["abc123"],
-        pattern=r"^[a-f0-9]+$",
-        min_length=1,
+        pattern=HEX_PATTERN,
     )
     """Specific revision of a gist"""
 
@@ -74,8 +74,7 @@ class WikiFilesystemConfig(FileSystemConfig):
     owner: str = Field(
         title="Repository Owner",
         examples=["microsoft", "facebook", "phil65"],
-        pattern=r"^[a-zA-Z0-9]([a-zA-Z0-9\-])*[a-zA-Z0-9]$|^[a-zA-Z0-9]$",
-        min_length=1,
+        pattern=GITHUB_NAME_PATTERN,
         max_length=39,
     )
     """GitHub repository owner/organization"""
@@ -83,8 +82,7 @@ class WikiFilesystemConfig(FileSystemConfig):
     repo: str = Field(
         title="Repository Name",
         examples=["vscode", "react", "upathtools"],
-        pattern=r"^[a-zA-Z0-9\._\-]+$",
-        min_length=1,
+        pattern=REPO_NAME_PATTERN,
         max_length=100,
     )
     """GitHub repository name"""
@@ -278,7 +276,7 @@ class McpToolsFilesystemConfig(FileSystemConfig):
     """If True, generate type stubs without implementation"""
 
 
-RemoteFilesystemConfig = (
+RemoteFilesystemConfig = Annotated[
     AppwriteFilesystemConfig
     | GistFilesystemConfig
     | GitLabFilesystemConfig
@@ -286,6 +284,7 @@ RemoteFilesystemConfig = (
     | McpFilesystemConfig
     | McpToolsFilesystemConfig
     | NotionFilesystemConfig
-    | WikiFilesystemConfig
-)
+    | WikiFilesystemConfig,
+    Field(discriminator="type"),
+]
 """Union of all remote filesystem configurations."""
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar, Literal
+from typing import TYPE_CHECKING, Annotated, ClassVar, Literal
 
 from pydantic import ConfigDict, Field, SecretStr
 
@@ -16,6 +16,12 @@ if TYPE_CHECKING:
     from pydantic import SecretStr
 
 
+_DEFAULT_DENY_READ = ["~/.ssh", "~/.aws", "~/.gnupg"]
+"""Credential directories SRT sandboxes may not read unless configured otherwise."""
+_DEFAULT_ALLOW_WRITE = ["."]
+"""Paths SRT sandboxes may write to unless configured otherwise."""
+
+
 class BeamFilesystemConfig(FileSystemConfig):
     """Configuration for Beam sandbox filesystem."""
 
@@ -175,7 +181,6 @@ class ModalFilesystemConfig(FileSystemConfig):
         title="Modal App Name",
         examples=["my-app", "data-processing", "ml-pipeline"],
         pattern=r"^[a-zA-Z0-9\-_]+$",
-        min_length=1,
         max_length=64,
     )
     """Modal application name"""
@@ -270,14 +275,14 @@ class SRTFilesystemConfig(FileSystemConfig):
     """Allow binding to localhost ports."""
 
     deny_read: list[str] = Field(
-        default_factory=lambda: ["~/.ssh", "~/.aws", "~/.gnupg"],
+        default_factory=_DEFAULT_DENY_READ.copy,
         title="Deny Read Paths",
         examples=[["~/.ssh", "~/.aws"]],
     )
     """Paths blocked from reading."""
 
     allow_write: list[str] = Field(
-        default_factory=lambda: ["."],
+        default_factory=_DEFAULT_ALLOW_WRITE.copy,
         title="Allow Write Paths",
         examples=[["."], [".", "/tmp"]],
     )
@@ -294,13 +299,14 @@ class SRTFilesystemConfig(FileSystemConfig):
     """Default timeout for operations in seconds."""
 
 
-SandboxFilesystemConfig = (
+SandboxFilesystemConfig = Annotated[
     BeamFilesystemConfig
     | DaytonaFilesystemConfig
     | E2BFilesystemConfig
     | ModalFilesystemConfig
     | MicrosandboxFilesystemConfig
     | SRTFilesystemConfig
-    | VercelFilesystemConfig
-)
+    | VercelFilesystemConfig,
+    Field(discriminator="type"),
+]
 """Union of all sandbox filesystem configurations."""
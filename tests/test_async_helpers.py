@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
 import os
 from pathlib import Path
 import tempfile
@@ -11,6 +14,7 @@ import pytest
 from upath import UPath
 
 from upathtools import async_ops
+from upathtools.async_helpers import to_thread
 
 
 if TYPE_CHECKING:
@@ -144,6 +148,29 @@ async def test_read_folder_nonexistent() -> None:
         await async_ops.read_folder("nonexistent_folder")
 
 
+async def test_to_thread_propagates_context() -> None:
+    """Test that context variables are carried over into the worker thread."""
+    var: contextvars.ContextVar[str] = contextvars.ContextVar("var", default="unset")
+    assert await to_thread(var.get) == "unset"
+    var.set("set")
+    assert await to_thread(var.get) == "set"
+
+
+async def test_to_thread_isolates_context() -> None:
+    """Test that context variables set in one call don't leak into the next one."""
+    var: contextvars.ContextVar[str] = contextvars.ContextVar("var", default="unset")
+
+    async def set_then_get() -> str:
+        await to_thread(var.set, "leaked")
+        return await to_thread(var.get)
+
+    # A single worker so both calls run on the same thread, from an empty context
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        asyncio.get_running_loop().set_default_executor(executor)
+        task = asyncio.create_task(set_then_get(), context=contextvars.Context())
+        assert await task == "unset"
+
+
 if __name__ == "__main__":
     import pytest
 
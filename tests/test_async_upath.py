@@ -0,0 +1,113 @@
+"""Tests for AsyncUPath."""
+
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING, Any
+
+from fsspec import register_implementation
+from fsspec.asyn import AbstractAsyncStreamedFile, AsyncFileSystem
+import pytest
+
+from upathtools.async_upath import AsyncUPath
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+async def test_write_and_read_many(tmp_path: Path):
+    """Test batched writes and reads round-trip per path."""
+    base = AsyncUPath(tmp_path)
+    data = {base / f"file{i}.txt": f"content{i}".encode() for i in range(5)}
+    await AsyncUPath.awrite_many(data)
+
+    result = await AsyncUPath.aread_many(data)
+    assert result == data
+    assert (tmp_path / "file3.txt").read_bytes() == b"content3"
+
+
+async def test_read_many_empty():
+    """Test that reading no paths returns an empty mapping."""
+    assert await AsyncUPath.aread_many([]) == {}
+
+
+async def test_iterdir_and_glob(tmp_path: Path):
+    """Test that listing and globbing yield AsyncUPath children."""
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "b.py").write_text("b")
+    base = AsyncUPath(tmp_path)
+
+    children = [p async for p in base.aiterdir()]
+    assert sorted(p.name for p in children) == ["a.txt", "b.py"]
+    assert all(isinstance(p, AsyncUPath) for p in children)
+
+    matches = [p async for p in base.aglob("*.txt")]
+    assert [p.name for p in matches] == ["a.txt"]
+
+
+async def test_glob_case_sensitive(tmp_path: Path):
+    """Test that the case_sensitive flag is honoured by aglob and arglob."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "A.TXT").write_text("a")
+    base = AsyncUPath(tmp_path)
+
+    assert [p async for p in base.arglob("*.txt", case_sensitive=True)] == []
+    matches = [p async for p in base.arglob("*.txt", case_sensitive=False)]
+    assert [p.name for p in matches] == ["A.TXT"]
+    assert all(isinstance(p, AsyncUPath) for p in matches)
+
+
+class _StreamedFile(AbstractAsyncStreamedFile):
+    async def _fetch_range(self, start: int, end: int) -> bytes:
+        return self.fs.store[self.path][start:end]
+
+
+class _BinaryOnlyAsyncFS(AsyncFileSystem):
+    """Async filesystem whose native open_async, like HTTP's, only supports binary modes."""
+
+    protocol = "binaryonlyasync"
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.store: dict[str, bytes] = {}
+
+    async def _info(self, path: str, **kwargs: Any) -> dict[str, Any]:
+        return {"name": path, "size": len(self.store[path]), "type": "file"}
+
+    def _open(self, path: str, mode: str = "rb", **kwargs: Any) -> io.BytesIO:
+        return io.BytesIO(self.store[path])
+
+    async def open_async(self, path: str, mode: str = "rb", **kwargs: Any) -> _StreamedFile:
+        return _StreamedFile(self, path, mode, size=len(self.store[path]), **kwargs)
+
+
+@pytest.mark.filterwarnings("ignore:UPath 'binaryonlyasync' filesystem")
+async def test_aopen_text_mode_on_binary_only_async_fs():
+    """Test that text modes fall back to the sync file while binary modes stay native."""
+    register_implementation(_BinaryOnlyAsyncFS.protocol, _BinaryOnlyAsyncFS, clobber=True)
+    path = AsyncUPath("binaryonlyasync://data.txt")
+    path.fs.store[path.path] = b"hello"
+
+    with await path.aopen() as text_file:
+        assert text_file.read() == "hello"
+
+    binary_file = await path.aopen("rb")
+    assert isinstance(binary_file, _StreamedFile)
+    assert await binary_file.read() == b"hello"
+    await binary_file.close()
+
+
+async def test_afs_shared_with_children(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that paths from aiterdir reuse the async filesystem of their parent."""
+    (tmp_path / "a.txt").write_text("a")
+    base = AsyncUPath(tmp_path)
+    fs = await base.afs()
+
+    def fail(*args: Any) -> None:
+        raise AssertionError("get_async_fs called again")
+
+    monkeypatch.setattr("upathtools.async_upath.get_async_fs", fail)
+    [child] = [p async for p in base.aiterdir()]
+    assert await child.afs() is fs
+    assert await (base / "a.txt").afs() is fs
@@ -0,0 +1,71 @@
+"""Tests for the CLI command parser."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from upath import UPath
+
+from upathtools.cli_parser import _parse_args, _parse_command, _parse_value, execute_cli_async
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("true", True),
+        ("FALSE", False),
+        ("42", 42),
+        ("-7", -7),
+        ("3.5", 3.5),
+        (".5", 0.5),
+        ("1e3", 1000.0),
+        ("-2.5E-1", -0.25),
+        ("TODO", "TODO"),
+        ("1.2.3", "1.2.3"),
+        ("", ""),
+    ],
+)
+def test_parse_value(value: str, expected: object) -> None:
+    """Test that values are converted to the matching Python type."""
+    result = _parse_value(value)
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+def test_parse_args() -> None:
+    """Test splitting positional arguments, long options and grouped short flags."""
+    args, kwargs = _parse_args(["TODO", "-rn", "5", "--max-count=3", "--exclude", "x", "src"])
+    assert args == ["TODO", "src"]
+    assert kwargs == {"recursive": True, "n": 5, "max_count": 3, "exclude": "x"}
+
+
+def test_parse_command_is_cached() -> None:
+    """Test that repeated commands reuse the parsed form."""
+    parsed = _parse_command("ls src -l")
+    assert parsed == ("ls", ("src",), (("long", True),))
+    assert _parse_command("ls src -l") is parsed
+    with pytest.raises(ValueError, match="Empty command"):
+        _parse_command("   ")
+
+
+async def test_execute_cli_dispatch(tmp_path: Path) -> None:
+    """Test that commands are routed to their handlers with parsed arguments."""
+    (tmp_path / "a.txt").write_text("hello\nTODO x\n")
+    base = UPath(tmp_path)
+
+    grep_result = await execute_cli_async("grep TODO a.txt", base)
+    assert [m.line for r in grep_result for m in r.matches] == ["TODO x"]
+
+    head_result = await execute_cli_async("head a.txt -n 1", base)
+    assert str(head_result) == "hello"
+
+
+async def test_execute_cli_unknown_command(tmp_path: Path) -> None:
+    """Test that unknown commands raise ValueError."""
+    with pytest.raises(ValueError, match="Unknown command"):
+        await execute_cli_async("frobnicate x", UPath(tmp_path))
@@ -0,0 +1,71 @@
+"""Tests for filesystem config models."""
+
+from __future__ import annotations
+
+from typing import Literal
+
+import pytest
+
+from upathtools_config import CliFilesystemConfig, FileSystemConfig, URIFileSystemConfig
+from upathtools_config.base import _parse_uri
+
+
+def test_from_trusted_dispatches_on_type():
+    """Test that trusted data is built into the registered config class."""
+    config = CliFilesystemConfig(shell=True)
+    restored = FileSystemConfig.from_trusted(dict(config))
+    assert isinstance(restored, CliFilesystemConfig)
+    assert restored == config
+
+
+@pytest.mark.parametrize("data", [{}, {"type": "does-not-exist"}])
+def test_from_trusted_rejects_missing_or_unknown_type(data: dict[str, str]):
+    """Test that trusted data without a registered type raises instead of falling back."""
+    with pytest.raises(ValueError, match="type"):
+        FileSystemConfig.from_trusted(data)
+
+
+def test_hash_ignores_dict_key_order():
+    """Test that equal configs with differently ordered dict fields hash the same."""
+    first = URIFileSystemConfig(uri="memory://", storage_options={"a": 1, "b": {"x": 1, "y": 2}})
+    second = URIFileSystemConfig(uri="memory://", storage_options={"b": {"y": 2, "x": 1}, "a": 1})
+    assert first == second
+    assert hash(first) == hash(second)
+
+
+@pytest.mark.parametrize(
+    ("uri", "expected"),
+    [
+        ("file:/tmp/x", ("file", "/tmp/x")),
+        ("file:///tmp/x", ("file", "/tmp/x")),
+        ("memory:/x", ("memory", "/x")),
+        ("s3://bucket/key", ("s3", "bucket/key")),
+        ("/tmp/x", ("file", "/tmp/x")),
+        ("data/x", ("file", "data/x")),
+        ("C:\\data\\x", ("file", "C:\\data\\x")),
+    ],
+)
+def test_parse_uri(uri: str, expected: tuple[str, str]):
+    """Test that URIs are split into protocol and path, plain paths staying local."""
+    assert _parse_uri(uri) == expected
+
+
+def test_subclass_replaces_registered_config(monkeypatch: pytest.MonkeyPatch):
+    """Test that a subclass keeping the type of a registered config takes its place."""
+    categories = {k: list(v) for k, v in FileSystemConfig._category_registry.items()}
+    monkeypatch.setattr(FileSystemConfig, "_registry", dict(FileSystemConfig._registry))
+    monkeypatch.setattr(FileSystemConfig, "_category_registry", categories)
+
+    class NarrowedCliConfig(CliFilesystemConfig):
+        shell: bool = True
+
+    assert type(FileSystemConfig.from_dict({"type": "cli"})) is NarrowedCliConfig
+    assert type(FileSystemConfig.from_trusted({"type": "cli"})) is NarrowedCliConfig
+    configs = FileSystemConfig.get_configs_by_category(NarrowedCliConfig._category)
+    assert NarrowedCliConfig in configs
+    assert CliFilesystemConfig not in configs
+
+    with pytest.raises(TypeError, match="already registered"):
+
+        class OtherCliConfig(FileSystemConfig):
+            type: Literal["cli"] = "cli"